@@ -0,0 +1,14 @@
+"""
+Airflow Assets marking each warehouse layer as built and quality-checked.
+
+Each layer DAG updates its asset from its success task, after the dbt build and the Soda
+checks passed, and the next layer is scheduled on that asset rather than on a cron offset.
+"""
+from __future__ import annotations
+
+from airflow.sdk import Asset
+
+BRONZE_LAYER = Asset(name="bronze_layer", uri="postgres-layer://bronze")
+STAGING_LAYER = Asset(name="staging_layer", uri="postgres-layer://staging")
+DWH_LAYER = Asset(name="dwh_layer", uri="postgres-layer://dwh")
+MART_LAYER = Asset(name="mart_layer", uri="postgres-layer://mart")
@@ -0,0 +1,272 @@
+"""
+In-process dbt execution for the DAG tasks.
+
+dbt runs through its programmatic entry point (dbtRunner) instead of a `dbt` subprocess, so
+a task pays interpreter start-up and adapter import once. Parsing is shared as well: the
+manifest is parsed once per process and handed to every later invocation, and dbt's
+partial-parse state lives in DBT_ARTIFACT_DIR, shared by all tasks and runs, so that one
+parse only re-reads the files changed since the last.
+
+Each invocation writes into its own scratch target directory, seeded from and published
+back to the shared one, so concurrent tasks never write the same artifact files.
+
+Slim runs keep, per layer, the manifest and source freshness of the layer's last successful
+build under DBT_ARTIFACT_DIR/state/<layer>, and select only the models whose code changed
+since (state:modified+) or whose bronze sources received new batches (source_status:fresher+).
+The day of a layer's last successful full refresh is kept there too, for the daily rebuilds.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Iterator, NamedTuple
+
+from dbt.cli.main import dbtRunner, dbtRunnerResult
+from dotenv import load_dotenv
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+# ENV: imported by the DAG files before their own load_dotenv()
+load_dotenv()
+
+DBT_PROJECT_DIR = os.getenv("DBT_PROJECT_DIR", "/opt/airflow/include/dbt")
+DBT_PROFILES_DIR = os.getenv("DBT_PROFILES_DIR", "/opt/airflow/include/dbt")
+DBT_ARTIFACT_DIR = os.getenv("DBT_ARTIFACT_DIR", os.path.join(DBT_PROJECT_DIR, "target"))
+
+PARTIAL_PARSE_FILE = "partial_parse.msgpack"
+# written by a parse and published to DBT_ARTIFACT_DIR for the next task
+SHARED_ARTIFACTS = (PARTIAL_PARSE_FILE, "manifest.json")
+FULL_REFRESH_FILE = "last_full_refresh"
+FAILED_STATUSES = ("error", "fail", "runtime error")
+
+
+class NodeResult(NamedTuple):
+    unique_id: str
+    status: str
+    message: str | None
+    execution_time: float
+    rows_affected: int | None
+    failures: int | None
+
+
+class DbtResult(NamedTuple):
+    command: str
+    success: bool
+    elapsed: float
+    nodes: list[NodeResult]
+
+    def by_status(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for node in self.nodes:
+            counts[node.status] = counts.get(node.status, 0) + 1
+        return counts
+
+    def failed(self) -> list[NodeResult]:
+        return [node for node in self.nodes if node.status in FAILED_STATUSES]
+
+
+class DbtCommandError(RuntimeError):
+    def __init__(self, message: str, result: DbtResult):
+        super().__init__(message)
+        self.result = result
+
+
+class DbtRunner(LoggingMixin):
+    def __init__(
+        self,
+        project_dir: str = DBT_PROJECT_DIR,
+        profiles_dir: str = DBT_PROFILES_DIR,
+        artifact_dir: str = DBT_ARTIFACT_DIR,
+        state_dir: str | None = None,
+    ):
+        super().__init__()
+        self.project_dir = project_dir
+        self.profiles_dir = profiles_dir
+        self.artifact_dir = artifact_dir
+        self.state_dir = state_dir or os.path.join(artifact_dir, "state")
+        # vars are a parse input, so manifests are cached per --vars value
+        self._manifests: dict[str, Any] = {}
+
+    def _cli_args(self, target_path: str, dbt_vars: dict | None) -> list[str]:
+        args = [
+            "--project-dir", self.project_dir,
+            "--profiles-dir", self.profiles_dir,
+            "--target-path", target_path,
+        ]
+        if dbt_vars:
+            args += ["--vars", json.dumps(dbt_vars, sort_keys=True)]
+        return args
+
+    @contextmanager
+    def _scratch_target(self) -> Iterator[str]:
+        with tempfile.TemporaryDirectory(prefix="dbt-target-") as target_path:
+            shared = os.path.join(self.artifact_dir, PARTIAL_PARSE_FILE)
+            if os.path.exists(shared):
+                shutil.copy2(shared, target_path)
+            yield target_path
+
+    def _replace(self, source: str, destination: str) -> None:
+        # copy next to the destination, then swap atomically for concurrent readers
+        staged = os.path.join(os.path.dirname(destination), f".{os.path.basename(destination)}.{os.getpid()}")
+        shutil.copy2(source, staged)
+        os.replace(staged, destination)
+
+    def _publish(self, target_path: str) -> None:
+        os.makedirs(self.artifact_dir, exist_ok=True)
+        for name in SHARED_ARTIFACTS:
+            source = os.path.join(target_path, name)
+            if os.path.exists(source):
+                self._replace(source, os.path.join(self.artifact_dir, name))
+
+    def _result(self, command: str, res: dbtRunnerResult, elapsed: float) -> DbtResult:
+        nodes = [
+            NodeResult(
+                unique_id=node_result.node.unique_id,
+                status=str(node_result.status),
+                message=node_result.message,
+                execution_time=node_result.execution_time,
+                rows_affected=(node_result.adapter_response or {}).get("rows_affected"),
+                failures=node_result.failures,
+            )
+            for node_result in getattr(res.result, "results", None) or []
+        ]
+        return DbtResult(command=command, success=res.success, elapsed=elapsed, nodes=nodes)
+
+    def manifest(self, dbt_vars: dict | None = None):
+        key = json.dumps(dbt_vars or {}, sort_keys=True)
+        if key not in self._manifests:
+            started = time.monotonic()
+            with self._scratch_target() as target_path:
+                res = dbtRunner().invoke(["parse", *self._cli_args(target_path, dbt_vars)])
+                if not res.success:
+                    result = self._result("parse", res, time.monotonic() - started)
+                    raise DbtCommandError("dbt parse failed", result) from res.exception
+                self._publish(target_path)
+            self.log.info("dbt project parsed in %.1fs", time.monotonic() - started)
+            self._manifests[key] = res.result
+        return self._manifests[key]
+
+    def invoke(
+        self,
+        command: str,
+        *args: str,
+        dbt_vars: dict | None = None,
+        check: bool = True,
+    ) -> DbtResult:
+        """
+        Run `dbt <command> <args>` against the cached manifest and return per-node results.
+        Raises DbtCommandError if dbt crashes, or if any node fails when check is set.
+        """
+        manifest = self.manifest(dbt_vars)
+        self.log.info("dbt %s %s", command, " ".join(args))
+        started = time.monotonic()
+        with self._scratch_target() as target_path:
+            res = dbtRunner(manifest=manifest).invoke(
+                [command, *args, *self._cli_args(target_path, dbt_vars)]
+            )
+        result = self._result(command, res, time.monotonic() - started)
+
+        self.log.info("dbt %s finished in %.1fs: %s", command, result.elapsed, result.by_status())
+        for node in result.failed():
+            self.log.error("%s %s: %s", node.unique_id, node.status, node.message)
+        if res.exception is not None:
+            raise DbtCommandError(f"dbt {command} crashed: {res.exception}", result) from res.exception
+        if check and not result.success:
+            raise DbtCommandError(f"dbt {command} failed ({len(result.failed())} failed nodes)", result)
+        return result
+
+    def slim_selection(self, layer: str, selectors: list[str], full: bool = False) -> list[str]:
+        """
+        Names of the models under `selectors` that `layer` has to build: all of them on a
+        full build or before the layer saved any state, otherwise only the changed ones.
+        Always snapshots source freshness first, for save_state() to record after the build.
+        """
+        layer_dir = os.path.join(self.state_dir, layer)
+        os.makedirs(os.path.join(layer_dir, "pending"), exist_ok=True)
+        has_state = all(
+            os.path.exists(os.path.join(layer_dir, name)) for name in ("manifest.json", "sources.json")
+        )
+        if has_state and not full:
+            selectors = [
+                f"{selector},{method}"
+                for selector in selectors
+                for method in ("state:modified+", "source_status:fresher+")
+            ]
+        manifest = self.manifest()
+        with self._scratch_target() as target_path:
+            # taken before the build, so batches landing meanwhile count as new next time
+            res = dbtRunner(manifest=manifest).invoke(["source", "freshness", *self._cli_args(target_path, None)])
+            if res.exception is not None:
+                raise DbtCommandError(
+                    f"dbt source freshness crashed: {res.exception}", self._result("source", res, 0.0)
+                ) from res.exception
+            self._replace(os.path.join(target_path, "sources.json"), os.path.join(layer_dir, "pending", "sources.json"))
+
+            res = dbtRunner(manifest=manifest).invoke([
+                "ls", "--resource-type", "model", "--output", "name",
+                "--select", *selectors,
+                *(["--state", layer_dir] if has_state and not full else []),
+                *self._cli_args(target_path, None),
+            ])
+        if not res.success:
+            raise DbtCommandError("dbt ls failed", self._result("ls", res, 0.0)) from res.exception
+        models = sorted(res.result or [])
+        self.log.info("Slim selection for %s (%s): %s", layer, "full" if full or not has_state else "changed", models)
+        return models
+
+    def save_state(self, layer: str) -> None:
+        """
+        Record the manifest and the pre-build freshness snapshot as `layer`'s last
+        successful build, the baseline of its next slim selection.
+        """
+        layer_dir = os.path.join(self.state_dir, layer)
+        pending = os.path.join(layer_dir, "pending", "sources.json")
+        if not os.path.exists(pending):
+            self.log.warning("No freshness snapshot for %s, state not saved", layer)
+            return
+        with tempfile.TemporaryDirectory(prefix="dbt-state-") as scratch:
+            self.manifest().write(os.path.join(scratch, "manifest.json"))
+            self._replace(os.path.join(scratch, "manifest.json"), os.path.join(layer_dir, "manifest.json"))
+        os.replace(pending, os.path.join(layer_dir, "sources.json"))
+        self.log.info("Saved dbt state for %s", layer)
+
+    def last_full_refresh(self, layer: str) -> date | None:
+        """
+        The day of `layer`'s last successful full refresh, None if it never had one.
+        """
+        path = os.path.join(self.state_dir, layer, FULL_REFRESH_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return date.fromisoformat(f.read().strip())
+
+    def save_full_refresh(self, layer: str, day: date) -> None:
+        layer_dir = os.path.join(self.state_dir, layer)
+        os.makedirs(layer_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="dbt-state-") as scratch:
+            staged = os.path.join(scratch, FULL_REFRESH_FILE)
+            with open(staged, "w") as f:
+                f.write(day.isoformat())
+            self._replace(staged, os.path.join(layer_dir, FULL_REFRESH_FILE))
+        self.log.info("Saved full refresh of %s on %s", layer, day)
+
+
+_runner: DbtRunner | None = None
+
+
+def get_runner() -> DbtRunner:
+    """
+    The process-wide DbtRunner, so every dbt call in a task shares one parsed manifest.
+    """
+    global _runner
+    if _runner is None:
+        _runner = DbtRunner()
+    return _runner
+
+
+def run_dbt(command: str, *args: str, **kwargs) -> DbtResult:
+    return get_runner().invoke(command, *args, **kwargs)
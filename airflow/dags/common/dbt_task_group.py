@@ -0,0 +1,121 @@
+"""
+Airflow task groups generated from dbt's manifest.json.
+
+Every selected model gets a `run_<model>` task followed by a `test_<model>` task, and the
+tasks are wired along the models' real ref() edges, so a model waits only for the tested
+models it reads from. Independent models run concurrently, bounded by DBT_POOL.
+
+Tests run per model with buildable indirect selection: a test spanning several models
+(e.g. relationships) runs once, with the downstream model, after all of its parents built.
+
+With a slim-run selection task, models it did not select are skipped, and the rest run
+once no upstream task failed.
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable
+
+from dotenv import load_dotenv
+from airflow.exceptions import AirflowSkipException
+from airflow.providers.standard.operators.python import PythonOperator
+from airflow.utils.task_group import TaskGroup
+
+from common.dbt_runner import DBT_ARTIFACT_DIR, run_dbt
+
+# ENV: imported by the DAG files before their own load_dotenv()
+load_dotenv()
+
+DBT_POOL = os.getenv("DBT_POOL", "default_pool")
+
+
+def load_manifest(artifact_dir: str = DBT_ARTIFACT_DIR) -> dict:
+    # read only: this runs on every DAG file parse, so never parse the dbt project here. The
+    # runner publishes manifest.json after every parse, and scripts/publish_dbt_manifest.py
+    # (run by airflow-init) publishes the first one
+    path = os.path.join(artifact_dir, "manifest.json")
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"No dbt manifest at {path}; run scripts/publish_dbt_manifest.py to publish one"
+        )
+    with open(path) as f:
+        return json.load(f)
+
+
+def _run_model(
+    model: str, tags: list[str], full_refresh: Callable | None, select_task_id: str | None
+) -> Callable:
+    def run(**context):
+        if select_task_id and model not in context["ti"].xcom_pull(task_ids=select_task_id):
+            raise AirflowSkipException(f"{model} unchanged since the last build")
+        args = ["--select", model]
+        if full_refresh is not None and full_refresh(context, tags):
+            args.append("--full-refresh")
+        run_dbt("run", *args)
+    return run
+
+
+def _test_model(model: str) -> Callable:
+    def test():
+        run_dbt("test", "--select", model, "--indirect-selection", "buildable")
+    return test
+
+
+def dbt_model_task_group(
+    group_id: str,
+    tags: list[str],
+    *,
+    pool: str = DBT_POOL,
+    full_refresh: Callable[[dict, list[str]], bool] | None = None,
+    select_task_id: str | None = None,
+    manifest: dict | None = None,
+) -> TaskGroup:
+    """
+    Build one task per model carrying any of `tags` (plus one per model with tests).
+    `full_refresh(context, model_tags)` decides per run whether a model is rebuilt
+    with --full-refresh; `select_task_id` names a task returning the model names to build
+    (see DbtRunner.slim_selection). Must be called inside a DAG context.
+    """
+    manifest = manifest or load_manifest()
+    models: dict[str, dict[str, Any]] = {
+        unique_id: node
+        for unique_id, node in manifest["nodes"].items()
+        if node["resource_type"] == "model" and set(node["tags"]) & set(tags)
+    }
+    tested = {
+        parent
+        for node in manifest["nodes"].values()
+        if node["resource_type"] == "test"
+        for parent in node["depends_on"]["nodes"]
+    }
+
+    with TaskGroup(group_id=group_id) as group:
+        # the task a downstream model waits on: the model's tests, or its run if untested
+        done = {}
+        runs = {}
+        for unique_id, node in sorted(models.items()):
+            name = node["name"]
+            runs[unique_id] = PythonOperator(
+                task_id=f"run_{name}",
+                python_callable=_run_model(name, node["tags"], full_refresh, select_task_id),
+                pool=pool,
+                # a skipped (unchanged) parent must not skip a selected child
+                trigger_rule="none_failed" if select_task_id else "all_success",
+            )
+            done[unique_id] = runs[unique_id]
+            if unique_id in tested:
+                done[unique_id] = PythonOperator(
+                    task_id=f"test_{name}",
+                    python_callable=_test_model(name),
+                    pool=pool,
+                )
+                runs[unique_id] >> done[unique_id]
+
+        for unique_id, node in models.items():
+            for parent in node["depends_on"]["nodes"]:
+                # parents outside the group (staging, sources) are built by other DAGs
+                if parent in models:
+                    done[parent] >> runs[unique_id]
+
+    return group
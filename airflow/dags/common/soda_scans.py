@@ -0,0 +1,75 @@
+"""
+Soda scans run as mapped tasks and folded into one exit code.
+
+Each checks file is scanned by its own task instance, at most SODA_MAX_PARALLEL at a time
+per DAG run, so the DQ wall time is that of the slowest scan instead of the sum. The
+outcome task returns the worst scan exit code (0 pass, 1 warn, 2 fail, 3 error), and 3 if
+no scan ran or any did not run to completion, for the DAG's single DQ branch.
+"""
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import subprocess
+
+from dotenv import load_dotenv
+from airflow.decorators import task
+from airflow.utils.task_group import TaskGroup
+
+# ENV: imported by the DAG files before their own load_dotenv()
+load_dotenv()
+
+SODA_CONFIG = os.getenv("SODA_CONFIG", "/opt/airflow/include/soda/soda_config.yml")
+SODA_CHECKS_DIR = os.getenv("SODA_CHECKS_DIR", "/opt/airflow/include/soda")
+SODA_MAX_PARALLEL = int(os.getenv("SODA_MAX_PARALLEL", "4"))
+SODA_SCAN_ERROR = 3
+
+
+def soda_checks(data_source: str, pattern: str, exclude: tuple[str, ...] = ()) -> list[dict]:
+    """
+    One scan per checks file under SODA_CHECKS_DIR matching `pattern`. Resolved when the DAG
+    file is parsed; no match leaves the group without scans, which its outcome reports as an error.
+    """
+    resolved = os.path.join(SODA_CHECKS_DIR, pattern)
+    scans = [
+        {"data_source": data_source, "checks": path}
+        for path in sorted(glob.glob(resolved))
+        if os.path.basename(path) not in exclude
+    ]
+    if not scans:
+        logging.warning("No Soda checks for %s match %s", data_source, resolved)
+    else:
+        logging.info("Soda checks for %s matching %s: %d", data_source, resolved, len(scans))
+    return scans
+
+
+def soda_scan_group(group_id: str, scans: list[dict], trigger_rule: str = "all_success"):
+    """
+    Build the mapped scans and their outcome task; returns the group (to wire upstream)
+    and the outcome XComArg (the aggregated exit code).
+    """
+    with TaskGroup(group_id=group_id) as group:
+
+        @task(trigger_rule=trigger_rule, max_active_tis_per_dagrun=SODA_MAX_PARALLEL)
+        def soda_scan(data_source: str, checks: str) -> int:
+            return subprocess.run(
+                ["soda", "scan", "-d", data_source, "-c", SODA_CONFIG, checks],
+            ).returncode
+
+        @task(trigger_rule="all_done")
+        def soda_outcome(exit_codes) -> int:
+            codes = list(exit_codes or [])
+            if not scans or not codes:
+                # an empty glob or mapping must not pass as a clean scan
+                logging.error("No Soda scans ran (%d configured)", len(scans))
+                return SODA_SCAN_ERROR
+            if len(codes) < len(scans):
+                logging.error("%d of %d Soda scans did not complete", len(scans) - len(codes), len(scans))
+                return SODA_SCAN_ERROR
+            logging.info("Soda scan exit codes: %s", codes)
+            return max(codes)
+
+        outcome = soda_outcome(soda_scan.expand_kwargs(scans))
+
+    return group, outcome
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import subprocess
 import logging
 import requests
 from dotenv import load_dotenv
@@ -10,16 +9,44 @@ from datetime import datetime, timedelta
 from airflow import DAG
 from airflow.decorators import task
 from airflow.providers.standard.operators.empty import EmptyOperator
-from airflow.utils.trigger_rule import TriggerRules
+from airflow.utils.trigger_rule import TriggerRule
+from airflow.exceptions import AirflowFailException
+
+from common.assets import DWH_LAYER, MART_LAYER
+from common.dbt_runner import get_runner, run_dbt
+from common.soda_scans import SODA_CHECKS_DIR, soda_scan_group
 
 # ENV
 load_dotenv()
 
-DBT_PROJECT_DIR = os.getenv("DBT_PROJECT_DIR", "/opt/airflow/include/dbt")
-DBT_PROFILES_DIR = os.getenv("DBT_PROFILES_DIR", "/opt/airflow/include/dbt")
-SODA_CONFIG = os.getenv("SODA_CONFIG", "/opt/airflow/include/soda/soda_config.yml")
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
 
+# one scan per mart domain: Soda data source and its checks file
+MART_SCANS = [
+    {"data_source": data_source, "checks": os.path.join(SODA_CHECKS_DIR, "mart", checks)}
+    for data_source, checks in [
+        ("mart_customer_support", "mart_customer_metrics.yml"),
+        ("mart_finance", "mart_daily_revenue.yml"),
+        ("mart_sales", "mart_orders.yml"),
+        ("mart_logistic", "mart_shipments.yml"),
+        ("mart_product", "mart_product_performance_success_case.yml"),
+    ]
+]
+
+# Time-grained marts recompute only the order days touched since their last build; the
+# first run after each full refresh of the facts is a full refresh as well
+
+
+def full_refresh_marts(context) -> bool:
+    last = get_runner().last_full_refresh("mart")
+    facts = get_runner().last_full_refresh("dwh")
+    return (
+        context["params"].get("full_refresh_marts")
+        or last is None
+        or (facts is not None and last < facts)
+    )
+
+
 DEFAULT_ARGS = {
     "owner": "DE-warehouse",
     "retries": 0,
@@ -29,105 +56,49 @@ DEFAULT_ARGS = {
 with DAG(
     dag_id="dag_analytics_scan_dq_mart",
     start_date=datetime(2024, 1, 1),
-    schedule="30 * * * *", # Hourly at minute 30
+    schedule=DWH_LAYER,  # as soon as the dwh is built and checked
+    max_active_runs=1,
     catchup=False,
     default_args=DEFAULT_ARGS,
     tags=["mart", "dbt", "soda"],
+    params={
+        "full_refresh_marts": False,
+        "slim_run": True,  # only models with changed code or new bronze batches
+    },
 ) as dag:
 
     start = EmptyOperator(task_id="start")
 
+    # SLIM RUN: nothing changed skips the rest of the run
+    @task.short_circuit(ignore_downstream_trigger_rules=True)
+    def select_mart_models(**context) -> list[str]:
+        full = not context["params"].get("slim_run") or full_refresh_marts(context)
+        return get_runner().slim_selection("mart", ["tag:mart"], full=full)
+
     # Build mart models only
     @task
-    def dbt_run_mart():
-        subprocess.run(
-            [
-              "dbt",
-              "run",
-              "--project-dir", "/opt/airflow/include/dbt",
-              "--profiles-dir", "/opt/airflow/include/dbt",
-              "--select", "tag:mart"
-            ],
-            check=True,
-        )
+    def dbt_run_mart(models: list[str], **context):
+        full_refresh = full_refresh_marts(context)
+        logging.info("Mart build: %s", "full refresh" if full_refresh else "incremental")
+        run_dbt("run", "--select", *models, *(["--full-refresh"] if full_refresh else []))
 
     # Run dbt tests on mart
     @task
-    def dbt_test_mart():
-        subprocess.run(
-            [
-              "dbt",
-              "test",
-              "--project-dir", "/opt/airflow/include/dbt",
-              "--profiles-dir", "/opt/airflow/include/dbt",
-              "--select", "tag:mart"
-            ],
-            check=True,
-        )
-    
-    # Run soda scan on mart | SODA SCANS (PER MART DOMAIN)
-    @task
-    def soda_scan_mart_cs_sp():
-        subprocess.run(
-            [
-                "soda", "scan",
-                "-d", "mart_customer_support",
-                "-c", SODA_CONFIG,
-                "/opt/airflow/include/soda/mart/mart_customer_metrics.yml"
-            ],
-            check=True
-        )
+    def dbt_test_mart(models: list[str]):
+        run_dbt("test", "--select", *models)
     
-    @task
-    def soda_scan_mart_dl_rv():
-        subprocess.run(
-            [
-                "soda", "scan",
-                "-d", "mart_finance",
-                "-c", SODA_CONFIG,
-                "/opt/airflow/include/soda/mart/mart_daily_revenue.yml"
-            ],
-            check=True
-        )
+    # SODA SCANS (PER MART DOMAIN): in parallel, one exit code for the DQ branch below
+    soda_scans, soda_exit = soda_scan_group("soda_scan_mart", MART_SCANS)
 
-    @task
-    def soda_scan_mart_ods():
-        subprocess.run(
-            [
-                "soda", "scan",
-                "-d", "mart_sales",
-                "-c", SODA_CONFIG,
-                "/opt/airflow/include/soda/mart/mart_orders.yml"
-            ],
-            check=True
-        )
+    @task.branch(trigger_rule="all_done")
+    def branch_on_mart_dq(exit_code: int) -> str:
+        if exit_code == 0:
+            return "mart_success"
+        else:
+            return "notify_slack"
 
-    @task
-    def soda_scan_mart_shp():
-        subprocess.run(
-            [
-                "soda", "scan",
-                "-d", "mart_logistic",
-                "-c", SODA_CONFIG,
-                "/opt/airflow/include/soda/mart/mart_shipments.yml"
-            ],
-            check=True
-        )
-
-    @task
-    def soda_scan_mart_pd_pf():
-        subprocess.run(
-            [
-                "soda", "scan",
-                "-d", "mart_product",
-                "-c", SODA_CONFIG,
-                "/opt/airflow/include/soda/mart/mart_product_performance.yml"
-            ],
-            check=True
-        )
-    
     # SLACK ALERT | PATH (FAIL)
-    @task(trigger_rule=TriggerRule.ONE_FAILED)
+    @task
     def notify_slack():
         logging.info("❌ MART PIPELINE FAILED")
         if not SLACK_WEBHOOK_URL:
@@ -145,28 +116,34 @@ with DAG(
 
         response = requests.post(SLACK_WEBHOOK_URL, json=payload)
         response.raise_for_status()
+
+    @task(trigger_rule="all_done")
+    def fail_pipeline() -> None:
+        raise AirflowFailException("Mart data quality violations detected")
     
     # MART OK PATH (SUCCESS)
-    @task(trigger_rule=TriggerRule.ALL_SUCCESS)
-    def mart_success():
+    @task(trigger_rule=TriggerRule.ALL_SUCCESS, outlets=[MART_LAYER])
+    def mart_success(**context):
+        # only a tested and checked build becomes the baseline of the next slim run
+        get_runner().save_state("mart")
+        if full_refresh_marts(context):
+            get_runner().save_full_refresh("mart", context["dag_run"].start_date.date())
         logging.info("🎉 MART PIPELINE SUCCESS")
     
     # DAG wiring
-    mart_checks = (
-       soda_scan_mart_cs_sp()
-       >> soda_scan_mart_dl_rv()
-       >> soda_scan_mart_ods()
-       >> soda_scan_mart_shp()
-       >> soda_scan_mart_pd_pf()
-       >> [mart_success(), notify_slack()]
-    )
+    branch = branch_on_mart_dq(soda_exit)
     end = EmptyOperator(task_id="end")
 
     # Flow
+    mart_models = select_mart_models()
     (
        start
-       >> dbt_run_mart()
-       >> dbt_test_mart()
-       >> mart_checks
-       >> end
+       >> mart_models
+       >> dbt_run_mart(mart_models)
+       >> dbt_test_mart(mart_models)
+       >> soda_scans
+       >> branch
     )
+
+    branch >> mart_success() >> end
+    branch >> notify_slack() >> fail_pipeline()
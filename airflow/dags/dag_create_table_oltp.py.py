@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import re
 import psycopg2
 from datetime import datetime, timedelta
 
@@ -17,6 +18,24 @@ from airflow.utils.log.logging_mixin import LoggingMixin
 DEFAULT_ROWS_PER_TABLE = 20_000
 DEFAULT_CHUNK_SIZE = 5_000
 
+BRONZE_TABLES = [
+    "bronze.customers_raw",
+    "bronze.products_raw",
+    "bronze.product_variants_raw",
+    "bronze.orders_raw",
+    "bronze.order_items_raw",
+    "bronze.payments_raw",
+    "bronze.shipments_raw",
+]
+
+# Partitioned bronze: daily RANGE partitions on _ingested_at named <table>_pYYYYMMDD (UTC days)
+# plus a DEFAULT partition. Maintenance keeps PARTITION_PREMAKE_DAYS future days ahead and
+# detaches (or drops) partitions older than PARTITION_RETENTION_DAYS.
+PARTITION_PREMAKE_DAYS = 7
+PARTITION_RETENTION_DAYS = 90
+EXPIRED_PARTITION_ACTIONS = ("detach", "drop")
+PARTITION_SUFFIX = re.compile(r"_p(\d{8})$")
+
 # DAG definition
 DEFAULT_ARGS = {
     "owner": "DE-operationals",
@@ -65,7 +84,11 @@ class BronzeSeeder(LoggingMixin):
         self.log.info("Postgres connection closed")
 
     # ------------------ DDL in its own autocommit connection ------------------
-    def create_tables_autocommit(self) -> None:
+    def create_tables_autocommit(self, partitioned: bool = False) -> None:
+        """
+        Create the bronze tables, range-partitioned on _ingested_at when `partitioned`,
+        with a BRIN index on (_ingested_at, _ts) either way.
+        """
         params = self._conn_params()
         self.log.info(
             "Running DDL in autocommit connection: %(host)s:%(port)d db=%(dbname)s user=%(user)s",
@@ -87,7 +110,7 @@ class BronzeSeeder(LoggingMixin):
           _op TEXT,
           _ts TIMESTAMPTZ,
           _deleted BOOLEAN DEFAULT FALSE
-        );
+        ){partition_by};
 
         CREATE TABLE IF NOT EXISTS bronze.products_raw (
           product_id BIGINT,
@@ -102,7 +125,7 @@ class BronzeSeeder(LoggingMixin):
           _op TEXT,
           _ts TIMESTAMPTZ,
           _deleted BOOLEAN DEFAULT FALSE
-        );
+        ){partition_by};
 
         CREATE TABLE IF NOT EXISTS bronze.product_variants_raw (
           variant_id BIGINT,
@@ -118,7 +141,7 @@ class BronzeSeeder(LoggingMixin):
           _op TEXT,
           _ts TIMESTAMPTZ,
           _deleted BOOLEAN DEFAULT FALSE
-        );
+        ){partition_by};
 
         CREATE TABLE IF NOT EXISTS bronze.orders_raw (
           order_id BIGINT,
@@ -134,7 +157,7 @@ class BronzeSeeder(LoggingMixin):
           _op TEXT,
           _ts TIMESTAMPTZ,
           _deleted BOOLEAN DEFAULT FALSE
-        );
+        ){partition_by};
 
         CREATE TABLE IF NOT EXISTS bronze.order_items_raw (
           order_item_id BIGINT,
@@ -153,7 +176,7 @@ class BronzeSeeder(LoggingMixin):
           _op TEXT,
           _ts TIMESTAMPTZ,
           _deleted BOOLEAN DEFAULT FALSE
-        );
+        ){partition_by};
 
         CREATE TABLE IF NOT EXISTS bronze.payments_raw (
           payment_id BIGINT,
@@ -168,7 +191,7 @@ class BronzeSeeder(LoggingMixin):
           _op TEXT,
           _ts TIMESTAMPTZ,
           _deleted BOOLEAN DEFAULT FALSE
-        );
+        ){partition_by};
 
         CREATE TABLE IF NOT EXISTS bronze.shipments_raw (
           shipment_id BIGINT,
@@ -184,15 +207,28 @@ class BronzeSeeder(LoggingMixin):
           _op TEXT,
           _ts TIMESTAMPTZ,
           _deleted BOOLEAN DEFAULT FALSE
-        );
+        ){partition_by};
         """
 
         conn = psycopg2.connect(**params)
         try:
             conn.autocommit = True
             cur = conn.cursor()
-            self.log.info("Executing DDL for bronze.* tables...")
-            cur.execute(ddl)
+            self.log.info("Executing DDL for bronze.* tables (partitioned=%s)...", partitioned)
+            cur.execute(ddl.format(partition_by=" PARTITION BY RANGE (_ingested_at)" if partitioned else ""))
+
+            for table in BRONZE_TABLES:
+                cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+                is_partitioned = cur.fetchone()[0] == "p"
+                if partitioned and not is_partitioned:
+                    self.log.warning("%s already exists unpartitioned; drop it to recreate it partitioned", table)
+                if is_partitioned:
+                    cur.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+
+                # BRIN: tiny, and _ingested_at/_ts follow insertion order so block ranges stay tight
+                index = f"{table.split('.')[1]}_ingested_brin"
+                cur.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} USING brin (_ingested_at, _ts)")
+
             cur.execute("SELECT to_regclass('bronze.customers_raw');")
             exists = cur.fetchone()[0]
             self.log.info("Post-DDL check – bronze.customers_raw = %s", exists)
@@ -202,10 +238,77 @@ class BronzeSeeder(LoggingMixin):
                 conn.close()
                 self.log.info("DDL autocommit connection closed")
 
+    # ------------------ Partition maintenance ------------------
+    def maintain_partitions(
+        self,
+        premake_days: int = PARTITION_PREMAKE_DAYS,
+        retention_days: int = PARTITION_RETENTION_DAYS,
+        expired_action: str = "detach",
+    ) -> None:
+        """
+        Create daily partitions from today up to today + premake_days, and detach (or
+        drop) the ones that end more than retention_days ago. Unpartitioned tables are skipped.
+        """
+        if expired_action not in EXPIRED_PARTITION_ACTIONS:
+            raise ValueError(
+                f"Unknown expired_action {expired_action!r}, expected one of {EXPIRED_PARTITION_ACTIONS}"
+            )
+
+        today = datetime.utcnow().date()
+        cutoff = today - timedelta(days=retention_days)
+
+        conn = psycopg2.connect(**self._conn_params())
+        try:
+            conn.autocommit = True
+            cur = conn.cursor()
+            for table in BRONZE_TABLES:
+                cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+                row = cur.fetchone()
+                if row is None or row[0] != "p":
+                    self.log.info("%s is not partitioned, skipping", table)
+                    continue
+
+                for offset in range(premake_days + 1):
+                    day = today + timedelta(days=offset)
+                    partition = f"{table}_p{day:%Y%m%d}"
+                    try:
+                        cur.execute(
+                            f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {table} "
+                            f"FOR VALUES FROM ('{day} 00:00:00+00') TO ('{day + timedelta(days=1)} 00:00:00+00')"
+                        )
+                    except psycopg2.errors.CheckViolation:
+                        # rows for that day already landed in the DEFAULT partition
+                        self.log.warning("Cannot create %s: the default partition holds rows for %s", partition, day)
+
+                cur.execute(
+                    """
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = %s::regclass
+                    """,
+                    (table,),
+                )
+                schema = table.split(".")[0]
+                for (name,) in cur.fetchall():
+                    match = PARTITION_SUFFIX.search(name)
+                    if not match:
+                        continue
+                    day = datetime.strptime(match.group(1), "%Y%m%d").date()
+                    if day + timedelta(days=1) > cutoff:
+                        continue
+                    cur.execute(f"ALTER TABLE {table} DETACH PARTITION {schema}.{name}")
+                    if expired_action == "drop":
+                        cur.execute(f"DROP TABLE {schema}.{name}")
+                    self.log.info("Expired partition %s.%s (%s)", schema, name, expired_action)
+            cur.close()
+        finally:
+            conn.close()
+
     # ------------------ Orchestration ------------------
-    def run(self) -> None:
+    def run(self, partitioned: bool = False) -> None:
         try:
-             self.create_tables_autocommit()
+             self.create_tables_autocommit(partitioned=partitioned)
              self.log.info("Bronze seeding completed successfully.")
 
         except Exception as e:
@@ -223,19 +326,59 @@ with DAG(
     catchup=False,
     default_args=DEFAULT_ARGS,
     tags=["bronze", "seed", "copy_from_stdin"],
+    params={
+        "partitioned": False,
+        "premake_days": PARTITION_PREMAKE_DAYS,
+        "retention_days": PARTITION_RETENTION_DAYS,
+        "expired_action": "detach",
+    },
 ) as dag:
 
     start = EmptyOperator(task_id="start")
 
     def create_bronze_callable(**kwargs):
+        params = kwargs.get("params") or {}
         seeder = BronzeSeeder(rows_per_table=DEFAULT_ROWS_PER_TABLE)
-        seeder.run()
+        seeder.run(partitioned=bool(params.get("partitioned", False)))
+
+    def maintain_partitions_callable(**kwargs):
+        params = kwargs.get("params") or {}
+        BronzeSeeder().maintain_partitions(
+            premake_days=int(params.get("premake_days", PARTITION_PREMAKE_DAYS)),
+            retention_days=int(params.get("retention_days", PARTITION_RETENTION_DAYS)),
+            expired_action=params.get("expired_action", "detach"),
+        )
 
     create_bronze = PythonOperator(
         task_id="create_bronze_tables",
         python_callable=create_bronze_callable,
     )
 
+    maintain_partitions = PythonOperator(
+        task_id="maintain_bronze_partitions",
+        python_callable=maintain_partitions_callable,
+    )
+
     end = EmptyOperator(task_id="end")
 
-    start >> create_bronze >> end
\ No newline at end of file
+    start >> create_bronze >> maintain_partitions >> end
+
+# Daily partition maintenance for partitioned bronze tables (no-op for unpartitioned ones)
+with DAG(
+    dag_id="maintain_bronze_partitions",
+    start_date=datetime(2023, 1, 1),
+    schedule="@daily",
+    catchup=False,
+    default_args=DEFAULT_ARGS,
+    tags=["bronze", "maintenance"],
+    params={
+        "premake_days": PARTITION_PREMAKE_DAYS,
+        "retention_days": PARTITION_RETENTION_DAYS,
+        "expired_action": "detach",
+    },
+) as maintenance_dag:
+
+    PythonOperator(
+        task_id="maintain_bronze_partitions",
+        python_callable=maintain_partitions_callable,
+    )
\ No newline at end of file
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import io
+import json
+import math
+import multiprocessing
 import os
 import random
+import re
+import struct
+import time
 import uuid
-import pandas as pd
+import zlib
+import numpy as np
 import psycopg2
-from datetime import datetime, timedelta as td
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import chain
+from typing import NamedTuple
+from datetime import datetime, timezone, timedelta as td
 from datetime import datetime as dt
 
 from dotenv import load_dotenv
-from faker import Faker
+from faker import VERSION as FAKER_VERSION, Faker
 from faker_commerce import Provider
 
 from airflow import DAG
@@ -19,6 +35,8 @@ from airflow.operators.python import PythonOperator
 from airflow.operators.empty import EmptyOperator
 from airflow.utils.log.logging_mixin import LoggingMixin
 
+from common.assets import BRONZE_LAYER
+
 # Global constants
 BRONZE_TABLES = [
     "bronze.customers_raw",
@@ -30,9 +48,320 @@ BRONZE_TABLES = [
     "bronze.shipments_raw",
 ]
 
+AUDIT_COLUMNS = ["_ingested_at", "_source", "_batch_id", "_op", "_ts", "_deleted"]
+
+BRONZE_COLUMNS = {
+    "bronze.customers_raw": [
+        "customer_id", "email", "name", "country", "created_at", "status",
+    ] + AUDIT_COLUMNS,
+    "bronze.products_raw": [
+        "product_id", "title", "category", "brand", "active", "created_at",
+    ] + AUDIT_COLUMNS,
+    "bronze.product_variants_raw": [
+        "variant_id", "product_id", "sku", "barcode", "price", "cost", "active",
+    ] + AUDIT_COLUMNS,
+    "bronze.orders_raw": [
+        "order_id", "channel_id", "customer_id", "order_ts", "status", "currency", "total_amount",
+    ] + AUDIT_COLUMNS,
+    "bronze.order_items_raw": [
+        "order_item_id", "order_id", "product_id", "variant_id", "qty",
+        "unit_price", "discount", "tax", "line_amount", "created_at",
+    ] + AUDIT_COLUMNS,
+    "bronze.payments_raw": [
+        "payment_id", "order_id", "method", "amount", "status", "paid_ts",
+    ] + AUDIT_COLUMNS,
+    "bronze.shipments_raw": [
+        "shipment_id", "order_id", "carrier", "service", "tracking_no", "shipped_ts", "status",
+    ] + AUDIT_COLUMNS,
+}
+
+# table -> generator name, resolved to gen_<name>_row / gen_<name>_batch
+BRONZE_GENERATORS = {
+    "bronze.customers_raw": "customer",
+    "bronze.products_raw": "product",
+    "bronze.product_variants_raw": "variant",
+    "bronze.orders_raw": "order",
+    "bronze.order_items_raw": "order_item",
+    "bronze.payments_raw": "payment",
+    "bronze.shipments_raw": "shipment",
+}
+
+# Value domains shared by the Python generators and the generate_series engine
+COUNTRIES = ["SG", "MY", "ID", "TH"]
+CUSTOMER_STATUSES = ["active", "inactive"]
+PRODUCT_CATEGORIES = ["Electronics", "Accessories", "Audio", "Storage"]
+ORDER_STATUSES = ["paid", "pending", "cancelled"]
+CURRENCIES = ["SGD", "MYR", "IDR", "THB"]
+PAYMENT_METHODS = ["CreditCard", "EWallet", "PayNow", "PayLater"]
+PAYMENT_STATUSES = ["paid", "pending", "failed", "refunded"]
+SHIPMENT_SERVICES = ["Standard", "Express"]
+SHIPMENT_STATUSES = ["processing", "shipped"]
+
 DEFAULT_ROWS_PER_TABLE = 20_000
 DEFAULT_CHUNK_SIZE = 5_000
 
+# Scale-factor mode: rows per table at SF 1, multiplied by scale_factor. The ratios follow
+# a typical shop: ~10 orders per customer, ~3 items per order, payments/shipments ~ orders.
+SCALE_FACTOR_ROWS = {
+    "bronze.customers_raw": 100_000,
+    "bronze.products_raw": 10_000,
+    "bronze.product_variants_raw": 30_000,
+    "bronze.orders_raw": 1_000_000,
+    "bronze.order_items_raw": 3_000_000,
+    "bronze.payments_raw": 1_050_000,
+    "bronze.shipments_raw": 950_000,
+}
+MIN_SCALE_FACTOR = 0.01
+MAX_SCALE_FACTOR = 100
+DEFAULT_SCALE_FACTOR_SEED = 42
+
+# "row": one gen_*_row call per row | "columnar": one gen_*_batch call per chunk
+GENERATION_MODES = ("row", "columnar")
+DEFAULT_GENERATION_MODE = "columnar"
+
+# COPY wire formats supported by BronzeSeeder._copy_table
+COPY_FORMATS = ("csv", "binary")
+DEFAULT_COPY_FORMAT = "csv"
+
+# Seeding engines:
+#   copy:            rows generated in Python and streamed with COPY FROM STDIN
+#   generate_series: INSERT ... SELECT FROM generate_series() per slice, rows are
+#                    generated inside Postgres and never cross the wire
+SEED_ENGINES = ("copy", "generate_series")
+DEFAULT_SEED_ENGINE = "copy"
+
+# Key space: parent tables get dense ids (first id below), children sample their foreign
+# keys from the parents' ids so every reference resolves. Variant j of the run belongs to
+# product j % n_products and gets variant_id = product_id * 10 + k, k = j // n_products + 1.
+PRODUCT_ID_START = 1_000
+MAX_VARIANTS_PER_PRODUCT = 9
+
+# Foreign-key distributions, configured per column via key_distributions:
+#   uniform:    every key in the range equally likely (default)
+#   zipf:       power law over key rank, P(rank k) ~ k^-s; larger s means hotter hot keys
+#   heavy_tail: mix of the two, a `mix` share of draws zipf and the rest uniform
+# Ranks are scattered over the parent ids (rank 1 -> first id) by a multiplicative hash.
+KEY_DISTRIBUTIONS = ("uniform", "zipf", "heavy_tail")
+KEY_COLUMNS = ("customer_id", "order_id", "product_id")
+DEFAULT_ZIPF_EXPONENT = 1.1
+DEFAULT_HEAVY_TAIL_MIX = 0.8
+KEY_SCATTER_PRIME = 2_654_435_761
+
+# Faker value pools: N distinct values per provider, generated once and sampled by index.
+# pool_size=None keeps one Faker call per value.
+FAKER_LOCALE = "en_US"
+FAKER_POOL_PROVIDERS = ("email", "name", "company", "ecommerce_name", "ean13")
+DEFAULT_POOL_SIZE = 20_000
+
+# (locale, faker version, pool seed, provider, size) -> pool; forked workers inherit it
+_FAKER_POOLS: dict[tuple, np.ndarray] = {}
+
+# Parallel seeding: worker processes, slice size, and how slices are committed.
+#   all_or_nothing: every slice is PREPAREd, then all are committed or all rolled back
+#   per_table:      each table commits on its own; multi-slice tables PREPARE their slices
+DEFAULT_WORKERS = 1
+COMMIT_POLICIES = ("all_or_nothing", "per_table")
+DEFAULT_COMMIT_POLICY = "all_or_nothing"
+PREPARED_GID_PREFIX = "bronze_seed"
+
+# Dataset cache: generated business columns per (table, seed, rows, offset, schema, settings)
+# as zstd Parquet; a hit streams the file into COPY with fresh audit columns instead of
+# generating. Least recently used files are evicted above the size limit.
+# Bump DATASET_CACHE_VERSION whenever a generator changes its output.
+DATASET_CACHE_VERSION = 1
+DEFAULT_DATASET_CACHE_MAX_BYTES = 20 * 1024**3
+
+# Checkpointed runs (run_id set): every chunk_size-row chunk commits on its own and is
+# recorded here; a rerun with the same run_id skips recorded chunks. Each chunk reseeds
+# the RNGs from rng_seed, so any chunk can be regenerated independently.
+SEED_RUNS_TABLE = "bronze.seed_runs"
+SEED_CHECKPOINTS_TABLE = "bronze.seed_checkpoints"
+
+# Fast-load mode: session settings for every seed connection, then secondary indexes are
+# dropped before the load and re-created after it (optionally loading into UNLOGGED tables)
+FAST_LOAD_SESSION_SETTINGS = {
+    "synchronous_commit": "off",
+    "maintenance_work_mem": "1GB",
+}
+
+# Streaming COPY: rows generated/encoded per block, bytes handed to copy_expert per read
+STREAM_BLOCK_ROWS = 10_000
+COPY_READ_SIZE = 1 << 20
+
+# Base timestamp + span used by _rand_ts / _rand_ts_batch
+RAND_TS_BASE = datetime(2024, 1, 1)
+RAND_TS_SPAN_MINUTES = 91 * 24 * 60
+
+
+# generate_series engine: SQL expressions mirroring the value domains of gen_*_row
+def _sql_randint(lo: int, hi: int) -> str:
+    # uniform integer in [lo, hi], like random.randint
+    return f"({lo} + floor(random() * {hi - lo + 1}))::bigint"
+
+
+def _sql_choice(values: list[str]) -> str:
+    items = ", ".join(f"'{v}'" for v in values)
+    return f"(ARRAY[{items}])[1 + floor(random() * {len(values)})::int]"
+
+
+def _sql_words(*choices: list[str]) -> str:
+    # stand-in for Faker text: one random word from each list, space separated
+    return " || ' ' || ".join(_sql_choice(words) for words in choices)
+
+
+SQL_RAND_TS = (
+    f"timestamptz '{RAND_TS_BASE:%Y-%m-%d} 00:00:00+00' + floor(random() * {RAND_TS_SPAN_MINUTES}) * interval '1 minute'"
+)
+SQL_AUDIT = "now(), 'pg_generate_series_seed', %(batch_id)s::uuid, 'I', now(), false"
+SQL_SERIES = "generate_series(1, %(rows)s) AS g"
+
+SQL_NAME = _sql_words(
+    ["Alex", "Sam", "Jordan", "Taylor", "Chris", "Morgan", "Jamie", "Casey"],
+    ["Tan", "Lim", "Wong", "Smith", "Nguyen", "Garcia", "Lee", "Brown"],
+)
+SQL_COMPANY = _sql_words(
+    ["Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay"],
+    ["Inc", "LLC", "Ltd", "Group", "PLC"],
+)
+SQL_PRODUCT_TITLE = _sql_words(
+    ["Ergonomic", "Sleek", "Rustic", "Practical", "Smart", "Compact"],
+    ["Steel", "Wooden", "Plastic", "Cotton", "Granite", "Rubber"],
+    ["Keyboard", "Mouse", "Headphones", "Speaker", "Cable", "Drive"],
+)
+
+def _sql_zipf_rank(n: int, s: float) -> str:
+    # inverse CDF of a power law on [1, n + 1), floored to a rank in 1..n
+    if s == 1:
+        return f"least(floor(power({n + 1}, random()))::bigint, {n})"
+    e = 1 - s
+    return f"least(floor(power({(n + 1) ** e - 1!r} * random() + 1, {1 / e!r}))::bigint, {n})"
+
+
+def _sql_key(spec: dict, lo: int, hi: int) -> str:
+    """
+    SQL draw of one foreign key in [lo, hi] following a normalized key distribution.
+    """
+    if spec["kind"] == "uniform":
+        return _sql_randint(lo, hi)
+    n = hi - lo + 1
+    zipf = f"({lo} + mod(({_sql_zipf_rank(n, spec['s'])} - 1) * {KEY_SCATTER_PRIME}, {n}))"
+    if spec["kind"] == "zipf":
+        return zipf
+    return f"(CASE WHEN random() < {spec['mix']!r} THEN {zipf} ELSE {_sql_randint(lo, hi)} END)"
+
+
+def series_selects(fk, table_rows: dict[str, int]) -> dict[str, str]:
+    """
+    One SELECT per table, columns in BRONZE_COLUMNS order; fk(column, lo, hi) renders
+    foreign-key draws. Ids follow the key space (see build_key_space): row offset + g.
+    Columns derived from other draws read them from a subquery; OFFSET 0 stops the
+    planner from flattening it and re-evaluating random() per reference.
+    """
+    n_customers = table_rows["bronze.customers_raw"]
+    n_products = table_rows["bronze.products_raw"]
+    n_variants = table_rows["bronze.product_variants_raw"]
+    n_orders = table_rows["bronze.orders_raw"]
+    row_id = "(%(offset)s + g)::bigint"
+    return {
+        "bronze.customers_raw": f"""
+            SELECT
+                {row_id},
+                'customer' || {_sql_randint(1, 1_000_000)} || '@example.com',
+                {SQL_NAME},
+                {_sql_choice(COUNTRIES)},
+                {SQL_RAND_TS},
+                {_sql_choice(CUSTOMER_STATUSES)},
+                {SQL_AUDIT}
+            FROM {SQL_SERIES}
+        """,
+        "bronze.products_raw": f"""
+            SELECT
+                {PRODUCT_ID_START - 1} + {row_id},
+                {SQL_PRODUCT_TITLE},
+                {_sql_choice(PRODUCT_CATEGORIES)},
+                {SQL_COMPANY},
+                true,
+                {SQL_RAND_TS},
+                {SQL_AUDIT}
+            FROM {SQL_SERIES}
+        """,
+        "bronze.product_variants_raw": f"""
+            SELECT
+                ({PRODUCT_ID_START} + mod(r.j, {n_products})) * 10 + r.j / {n_products} + 1,
+                {PRODUCT_ID_START} + mod(r.j, {n_products}),
+                'SKU-' || upper(substr(md5(random()::text), 1, 8)),
+                lpad({_sql_randint(0, 10**13 - 1)}::text, 13, '0'),
+                r.price,
+                (1 + floor(random() * r.price))::bigint,
+                true,
+                {SQL_AUDIT}
+            FROM (
+                SELECT {row_id} - 1 AS j, {_sql_randint(5, 500)} AS price
+                FROM {SQL_SERIES}
+                OFFSET 0
+            ) AS r
+        """,
+        "bronze.orders_raw": f"""
+            SELECT
+                {row_id},
+                {_sql_randint(1, 8)},
+                {fk("customer_id", 1, n_customers)},
+                {SQL_RAND_TS},
+                {_sql_choice(ORDER_STATUSES)},
+                {_sql_choice(CURRENCIES)},
+                {_sql_randint(10, 100_000)},
+                {SQL_AUDIT}
+            FROM {SQL_SERIES}
+        """,
+        "bronze.order_items_raw": f"""
+            SELECT
+                r.id,
+                {fk("order_id", 1, n_orders)},
+                {PRODUCT_ID_START} + mod(r.v, {n_products}),
+                ({PRODUCT_ID_START} + mod(r.v, {n_products})) * 10 + r.v / {n_products} + 1,
+                r.qty,
+                r.unit_price,
+                r.discount,
+                floor(r.unit_price * 0.07)::bigint,
+                r.qty * (r.unit_price - r.discount) + floor(r.unit_price * 0.07)::bigint,
+                {SQL_RAND_TS},
+                {SQL_AUDIT}
+            FROM (
+                SELECT
+                    {row_id} AS id,
+                    {fk("product_id", 0, n_variants - 1)} AS v,
+                    {_sql_randint(1, 5)} AS qty,
+                    {_sql_randint(5, 500)} AS unit_price,
+                    {_sql_randint(0, 5)} AS discount
+                FROM {SQL_SERIES}
+                OFFSET 0
+            ) AS r
+        """,
+        "bronze.payments_raw": f"""
+            SELECT
+                {row_id},
+                {fk("order_id", 1, n_orders)},
+                {_sql_choice(PAYMENT_METHODS)},
+                {_sql_randint(10, 100_000)},
+                {_sql_choice(PAYMENT_STATUSES)},
+                {SQL_RAND_TS},
+                {SQL_AUDIT}
+            FROM {SQL_SERIES}
+        """,
+        "bronze.shipments_raw": f"""
+            SELECT
+                {row_id},
+                {fk("order_id", 1, n_orders)},
+                {SQL_COMPANY},
+                {_sql_choice(SHIPMENT_SERVICES)},
+                'TRK-' || upper(substr(md5(random()::text), 1, 10)),
+                {SQL_RAND_TS},
+                {_sql_choice(SHIPMENT_STATUSES)},
+                {SQL_AUDIT}
+            FROM {SQL_SERIES}
+        """,
+    }
+
 # DAG definition
 DEFAULT_ARGS = {
     "owner": "DE-operationals",
@@ -40,34 +369,437 @@ DEFAULT_ARGS = {
     "retries": 0,
 }
 
-# BronzeSeeder using pandas + SQLAlchemy
+# Streaming file-like adapter for copy_expert
+class CopyStream:
+    """
+    Read-only file-like object over an iterator of encoded CSV blocks.
+
+    copy_expert pulls fixed-size reads; blocks are produced lazily, so only
+    the block currently being drained is held in memory.
+    """
+
+    def __init__(self, blocks: Iterable[bytes]) -> None:
+        self._blocks = iter(blocks)
+        self._buf = bytearray()
+        self._exhausted = False
+
+    def _fill(self, size: int) -> None:
+        while not self._exhausted and (size < 0 or len(self._buf) < size):
+            try:
+                self._buf += next(self._blocks)
+            except StopIteration:
+                self._exhausted = True
+
+    def read(self, size: int = -1) -> bytes:
+        self._fill(size)
+        if size < 0 or size > len(self._buf):
+            size = len(self._buf)
+        out = bytes(self._buf[:size])
+        del self._buf[:size]
+        return out
+
+    def readline(self, size: int = -1) -> bytes:
+        while b"\n" not in self._buf and not self._exhausted:
+            self._fill(len(self._buf) + 1)
+        end = self._buf.find(b"\n") + 1 or len(self._buf)
+        if 0 <= size < end:
+            end = size
+        return self.read(end)
+
+
+# PostgreSQL binary COPY encoder
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+PG_EPOCH = np.datetime64("2000-01-01T00:00:00", "us")
+
+# format_type() / DDL spelling -> binary encoder kind
+PG_BINARY_KINDS = {
+    "bigint": "int8",
+    "integer": "int4",
+    "int": "int4",
+    "boolean": "bool",
+    "uuid": "uuid",
+    "text": "text",
+    "timestamp with time zone": "timestamptz",
+    "timestamptz": "timestamptz",
+    "numeric": "numeric",
+}
+
+
+class BinaryCopyEncoder:
+    """
+    Encodes row blocks into PostgreSQL's binary COPY tuple format.
+
+    Column kinds come from the table's declared types (BIGINT, INT,
+    NUMERIC(p,s), TIMESTAMPTZ, UUID, BOOLEAN, TEXT). Every column is turned
+    into per-row field bytes with NumPy and scattered into one output buffer,
+    so a block costs a handful of array operations instead of a struct.pack
+    per field. Aware timestamps are converted to UTC and naive ones are taken
+    as UTC; NULLs are not supported.
+    """
+
+    def __init__(self, pg_types: list[str]) -> None:
+        self.kinds: list[tuple[str, int, int]] = []
+        for pg_type in pg_types:
+            match = re.fullmatch(
+                r"\s*([a-z ]+?)\s*(?:\((\d+)\s*,\s*(\d+)\))?\s*", pg_type.lower()
+            )
+            kind = PG_BINARY_KINDS.get(match.group(1)) if match else None
+            if kind is None:
+                raise ValueError(f"Unsupported column type for binary COPY: {pg_type!r}")
+            precision = int(match.group(2) or 38)
+            scale = int(match.group(3) or 0)
+            self.kinds.append((kind, precision, scale))
+
+    def encode_rows(self, rows: list[list]) -> bytes:
+        return self.encode_batch([list(col) for col in zip(*rows)])
+
+    def encode_batch(self, arrays: list) -> bytes:
+        if len(arrays) != len(self.kinds):
+            raise ValueError(f"Expected {len(self.kinds)} columns, got {len(arrays)}")
+        n = len(arrays[0])
+
+        # per column: field bytes as (n, width) uint8, padded, + used bytes per row
+        fields = [
+            self._encode_column(kind, precision, scale, values)
+            for (kind, precision, scale), values in zip(self.kinds, arrays)
+        ]
+
+        # tuple header (int16 field count) + fields side by side; row-major
+        # order of the matrix is already the wire order once padding is dropped
+        field_count = np.frombuffer(struct.pack(">h", len(fields)), dtype=np.uint8)
+        matrix = np.hstack([np.broadcast_to(field_count, (n, 2))] + [data for data, _ in fields])
+
+        if all(data.shape[1] == used.min() for data, used in fields if len(used)):
+            return matrix.tobytes()
+
+        keep = np.hstack(
+            [np.ones((n, 2), dtype=bool)]
+            + [np.arange(data.shape[1]) < used[:, None] for data, used in fields]
+        )
+        return matrix[keep].tobytes()
+
+    @staticmethod
+    def _with_length(payload: np.ndarray, used: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # prefix every field with its int32 byte length
+        n = payload.shape[0]
+        prefix = used.astype(">i4").view(np.uint8).reshape(n, 4)
+        return np.hstack([prefix, payload]), used + 4
+
+    def _fixed(self, values: np.ndarray, dtype: str) -> tuple[np.ndarray, np.ndarray]:
+        be = np.ascontiguousarray(values.astype(dtype))
+        payload = be.view(np.uint8).reshape(len(be), be.dtype.itemsize)
+        return self._with_length(payload, np.full(len(be), be.dtype.itemsize, dtype=np.int64))
+
+    def _encode_column(
+        self, kind: str, precision: int, scale: int, values
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if kind == "int8":
+            return self._fixed(np.asarray(values, dtype=np.int64), ">i8")
+        if kind == "int4":
+            return self._fixed(np.asarray(values, dtype=np.int64), ">i4")
+        if kind == "bool":
+            return self._fixed(np.asarray(values, dtype=bool), "u1")
+        if kind == "timestamptz":
+            values = np.asarray(values)
+            if values.dtype == object:
+                # row path: datetime objects, aware ones normalized to naive UTC
+                values = np.array([
+                    v.astimezone(timezone.utc).replace(tzinfo=None) if v.tzinfo else v for v in values
+                ])
+            micros = np.asarray(values, dtype="datetime64[us]") - PG_EPOCH
+            return self._fixed(micros.astype(np.int64), ">i8")
+        if kind == "uuid":
+            keys, inverse = np.unique(np.asarray(values).astype(str), return_inverse=True)
+            table = np.frombuffer(b"".join(uuid.UUID(k).bytes for k in keys), dtype=np.uint8)
+            payload = table.reshape(len(keys), 16)[inverse.reshape(-1)]
+            return self._with_length(payload, np.full(len(payload), 16, dtype=np.int64))
+        if kind == "numeric":
+            return self._encode_numeric(np.asarray(values), precision, scale)
+        # text: plain cast for ASCII, utf-8 codec only when needed
+        values = np.asarray(values).astype(str)
+        try:
+            encoded = values.astype(bytes)
+        except UnicodeEncodeError:
+            encoded = np.char.encode(values, "utf-8")
+        if encoded.dtype.itemsize == 0:
+            encoded = encoded.astype("S1")
+        payload = encoded.view(np.uint8).reshape(len(encoded), encoded.dtype.itemsize)
+        return self._with_length(payload, np.char.str_len(encoded).astype(np.int64))
+
+    def _encode_numeric(
+        self, values: np.ndarray, precision: int, scale: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        NUMERIC(p,s) as fixed-width base-10000 digits; the server strips
+        leading/trailing zero digits when it builds the value.
+        """
+        int_groups = max(-(-(precision - scale) // 4), 1)
+        frac_groups = -(-scale // 4)
+        ndigits = int_groups + frac_groups
+
+        if values.dtype.kind == "f":
+            scaled = np.rint(np.abs(values) * 10**scale).astype(np.int64)
+        else:
+            scaled = np.abs(values.astype(np.int64)) * 10**scale
+        whole, frac = np.divmod(scaled, 10**scale)
+        frac = frac * 10 ** (4 * frac_groups - scale)
+
+        digits = np.empty((len(values), ndigits), dtype=np.int64)
+        for g in range(int_groups):
+            digits[:, int_groups - 1 - g] = (whole // 10_000**g) % 10_000
+        for g in range(frac_groups):
+            digits[:, int_groups + frac_groups - 1 - g] = (frac // 10_000**g) % 10_000
+
+        head = np.empty((len(values), 4), dtype=np.int64)
+        head[:, 0] = ndigits                                    # ndigits
+        head[:, 1] = int_groups - 1                             # weight
+        head[:, 2] = np.where(values < 0, 0x4000, 0x0000)       # sign
+        head[:, 3] = scale                                      # dscale
+
+        be = np.ascontiguousarray(np.hstack([head, digits]).astype(">i2"))
+        payload = be.view(np.uint8).reshape(len(values), 2 * (4 + ndigits))
+        return self._with_length(payload, np.full(len(values), payload.shape[1], dtype=np.int64))
+
+
+class KeySpace(NamedTuple):
+    """
+    Parent key ranges of one seeding run, shared by every child generator. Ids are
+    computed from row positions (ints, slices or int arrays) instead of being stored, so
+    memory stays constant at any scale factor.
+    """
+    n_customers: int
+    n_products: int
+    n_variants: int
+    n_orders: int
+
+    @staticmethod
+    def _positions(pos):
+        # a slice is one chunk's rows: only that chunk is materialized
+        if isinstance(pos, slice):
+            return np.arange(pos.start, pos.stop, dtype=np.int64)
+        return pos
+
+    def customer_id(self, pos):
+        return self._positions(pos) + 1
+
+    def product_id(self, pos):
+        return self._positions(pos) + PRODUCT_ID_START
+
+    def variant_product_id(self, pos):
+        return self._positions(pos) % self.n_products + PRODUCT_ID_START
+
+    def variant_id(self, pos):
+        pos = self._positions(pos)
+        return self.variant_product_id(pos) * 10 + pos // self.n_products + 1
+
+    def order_id(self, pos):
+        return self._positions(pos) + 1
+
+
+def build_key_space(table_rows: dict[str, int]) -> KeySpace:
+    n_customers = table_rows["bronze.customers_raw"]
+    n_products = table_rows["bronze.products_raw"]
+    n_variants = table_rows["bronze.product_variants_raw"]
+    n_orders = table_rows["bronze.orders_raw"]
+    if n_variants > n_products * MAX_VARIANTS_PER_PRODUCT:
+        raise ValueError(
+            f"{n_variants} variants for {n_products} products: at most "
+            f"{MAX_VARIANTS_PER_PRODUCT} variants per product fit variant_id = product_id * 10 + k"
+        )
+    return KeySpace(n_customers, n_products, n_variants, n_orders)
+
+
+class SeedSlice(NamedTuple):
+    table: str
+    index: int
+    offset: int  # first row of the slice within the table
+    rows: int
+    seed: int | None
+    gid: str | None  # prepared-transaction id, None = plain commit
+
+
+def _seed_slice_worker(settings: dict, task: SeedSlice) -> SeedSlice:
+    """
+    Process-pool entry point: load one slice of one table over its own connection.
+    """
+    seeder = BronzeSeeder(**{**settings, "seed": task.seed})
+    try:
+        if task.gid:
+            seeder.conn.rollback()  # end the implicit transaction left by _open_connection
+            seeder.conn.tpc_begin(task.gid)
+        seeder._seed_table(task.table, task.offset, task.rows)
+        if task.gid:
+            seeder.conn.tpc_prepare()
+        else:
+            seeder.conn.commit()
+    except Exception:
+        if task.gid:
+            seeder.conn.tpc_rollback()
+        else:
+            seeder.conn.rollback()
+        raise
+    finally:
+        seeder._close_connection()
+    return task
+
+
+def normalize_key_distribution(spec: str | dict) -> dict:
+    """
+    "zipf" or {"kind": "zipf", "s": 1.3} -> {"kind": ..., "s": ..., "mix": ...}
+    """
+    if isinstance(spec, str):
+        spec = {"kind": spec}
+    kind = spec.get("kind", "uniform")
+    if kind not in KEY_DISTRIBUTIONS:
+        raise ValueError(f"Unknown key distribution {kind!r}, expected one of {KEY_DISTRIBUTIONS}")
+
+    s = float(spec.get("s", DEFAULT_ZIPF_EXPONENT))
+    mix = float(spec.get("mix", DEFAULT_HEAVY_TAIL_MIX))
+    if s <= 0:
+        raise ValueError(f"Zipf exponent s must be > 0, got {s}")
+    if not 0 <= mix <= 1:
+        raise ValueError(f"heavy_tail mix must be within [0, 1], got {mix}")
+    return {"kind": kind, "s": s, "mix": mix}
+
+
+def scale_factor_rows(scale_factor: float) -> dict[str, int]:
+    """
+    Row count per bronze table for a scale factor (at least one row each).
+    """
+    return {table: max(round(rows * scale_factor), 1) for table, rows in SCALE_FACTOR_ROWS.items()}
+
+
+# BronzeSeeder streaming generated rows through COPY FROM STDIN
 class BronzeSeeder(LoggingMixin):
     def __init__(
         self,
         rows_per_table: int = DEFAULT_ROWS_PER_TABLE,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        generation_mode: str = "row",
+        seed: int | None = None,
+        copy_format: str = DEFAULT_COPY_FORMAT,
+        workers: int = DEFAULT_WORKERS,
+        slice_rows: int | None = None,
+        commit_policy: str = DEFAULT_COMMIT_POLICY,
+        engine: str = DEFAULT_SEED_ENGINE,
+        pool_size: int | dict[str, int] | None = None,
+        pool_cache_dir: str | None = None,
+        pool_seed: int | None = None,
+        scale_factor: float | None = None,
+        key_distributions: dict[str, str | dict] | None = None,
+        run_id: str | None = None,
+        dataset_cache_dir: str | None = None,
+        dataset_cache_max_bytes: int = DEFAULT_DATASET_CACHE_MAX_BYTES,
+        fast_load: bool = False,
+        unlogged: bool = False,
     ) -> None:
         super().__init__()
         load_dotenv()
 
+        if scale_factor is not None:
+            scale_factor = float(scale_factor)
+            if not MIN_SCALE_FACTOR <= scale_factor <= MAX_SCALE_FACTOR:
+                raise ValueError(
+                    f"scale_factor must be between {MIN_SCALE_FACTOR} and {MAX_SCALE_FACTOR}, "
+                    f"got {scale_factor}"
+                )
+            # benchmark datasets must be reproducible
+            if seed is None:
+                seed = DEFAULT_SCALE_FACTOR_SEED
+
+        if generation_mode not in GENERATION_MODES:
+            raise ValueError(
+                f"Unknown generation_mode {generation_mode!r}, expected one of {GENERATION_MODES}"
+            )
+
+        if copy_format not in COPY_FORMATS:
+            raise ValueError(f"Unknown copy_format {copy_format!r}, expected one of {COPY_FORMATS}")
+
+        if engine not in SEED_ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {SEED_ENGINES}")
+
+        if run_id and int(workers) > 1:
+            raise ValueError("Checkpointed runs (run_id) commit chunk by chunk and need workers=1")
+
+        if commit_policy not in COMMIT_POLICIES:
+            raise ValueError(
+                f"Unknown commit_policy {commit_policy!r}, expected one of {COMMIT_POLICIES}"
+            )
+
         self.rows_per_table = rows_per_table
+        self.scale_factor = scale_factor
+        self.table_rows = scale_factor_rows(scale_factor) if scale_factor else {
+            table: rows_per_table for table in BRONZE_TABLES
+        }
         self.chunk_size = chunk_size
+        self.generation_mode = generation_mode
+        self.copy_format = copy_format
+        self.seed = seed
+        self.workers = max(int(workers), 1)
+        self.run_id = run_id
+        self.fast_load = fast_load or unlogged
+        self.unlogged = unlogged
+        self.timings: dict[str, float] = {}
+        self.slice_rows = slice_rows
+        self.commit_policy = commit_policy
+        self.engine = engine
+        self.key_distributions = {
+            column: normalize_key_distribution(spec)
+            for column, spec in (key_distributions or {}).items()
+        }
+        unknown = set(self.key_distributions) - set(KEY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown key column(s) {sorted(unknown)}, expected some of {KEY_COLUMNS}")
+
+        # pool_size: one size for every provider, or {provider: size}; pools are seeded
+        # with pool_seed (defaults to seed) so slices of one run share the same pools
+        if isinstance(pool_size, dict):
+            unknown = set(pool_size) - set(FAKER_POOL_PROVIDERS)
+            if unknown:
+                raise ValueError(f"Unknown Faker pool provider(s): {sorted(unknown)}")
+            self.pool_sizes = {p: int(n) for p, n in pool_size.items() if n}
+        elif pool_size:
+            self.pool_sizes = {p: int(pool_size) for p in FAKER_POOL_PROVIDERS}
+        else:
+            self.pool_sizes = {}
+        self.pool_cache_dir = pool_cache_dir
+        self.dataset_cache_dir = dataset_cache_dir
+        self.dataset_cache_max_bytes = int(dataset_cache_max_bytes)
+        self.pool_seed = seed if pool_seed is None else pool_seed
+
+        self.key_space = build_key_space(self.table_rows)
+        self._row_pos = 0  # position of the next generated row within the current table
 
-        self.fake = Faker()
+        self.fake = Faker(FAKER_LOCALE)
         self.fake.add_provider(Provider)
+        self.rng = np.random.default_rng(seed)
+        if seed is not None:
+            random.seed(seed)
+            self.fake.seed_instance(seed)
+
+        if dataset_cache_dir and seed is None:
+            self.log.warning("dataset_cache_dir is ignored without a seed: unseeded data is not reusable")
 
         self.conn: psycopg2.extensions.connection | None = None
         self.cur: psycopg2.extensions.cursor | None = None
         self._open_connection()
 
     def _conn_params(self) -> dict:
-        return dict(
+        params = dict(
             host=os.getenv("PGHOST"),
             port=int(os.getenv("PGPORT")),
             dbname=os.getenv("PGDATABASE"),
             user=os.getenv("PGUSER"),
             password=os.getenv("PGPASSWORD"),
         )
+        if self.fast_load:
+            # startup options are the session defaults, so a rollback (e.g. the slice
+            # workers' before tpc_begin) cannot revert them the way it reverts a SET
+            params["options"] = " ".join(
+                f"-c {name}={value}" for name, value in FAST_LOAD_SESSION_SETTINGS.items()
+            )
+        return params
 
     def _open_connection(self) -> None:
         params = self._conn_params()
@@ -76,6 +808,9 @@ class BronzeSeeder(LoggingMixin):
         self.conn.autocommit = False
         self.cur = self.conn.cursor()
 
+        if self.fast_load:
+            self.log.info("Fast-load session settings: %s", FAST_LOAD_SESSION_SETTINGS)
+
         self.cur.execute("SELECT current_database(), current_schema();")
         db, schema = self.cur.fetchone()
         self.log.info("Seed connection using database=%s schema=%s", db, schema)
@@ -89,15 +824,167 @@ class BronzeSeeder(LoggingMixin):
 
     # Helpers
     def _rand_ts(self) -> datetime:
-        base = datetime(2024, 1, 1)
-        return base + td(
+        return RAND_TS_BASE.replace(tzinfo=timezone.utc) + td(
             days=random.randint(0, 90),
             hours=random.randint(0, 23),
             minutes=random.randint(0, 59),
         )
 
+    def _seed_rngs(self, seed: int) -> None:
+        self.rng = np.random.default_rng(seed)
+        random.seed(seed)
+        self.fake.seed_instance(seed)
+
+    def _rand_ts_batch(self, n: int) -> np.ndarray:
+        # same domain as _rand_ts: minute resolution over 91 days, naive UTC
+        minutes = self.rng.integers(0, RAND_TS_SPAN_MINUTES, n)
+        return np.datetime64(RAND_TS_BASE, "s") + (minutes * 60).astype("timedelta64[s]")
+
+    def _choice_batch(self, values: list, n: int) -> np.ndarray:
+        return np.asarray(values)[self.rng.integers(0, len(values), n)]
+
+    def _fk_batch(self, column: str, lo: int, hi: int, n: int) -> np.ndarray:
+        """
+        n foreign keys in [lo, hi] drawn from the column's key distribution.
+        """
+        spec = self.key_distributions.get(column)
+        if spec is None or spec["kind"] == "uniform":
+            return self.rng.integers(lo, hi + 1, n)
+
+        size = hi - lo + 1
+        u = self.rng.random(n)
+        if spec["s"] == 1:
+            x = np.power(size + 1.0, u)
+        else:
+            e = 1 - spec["s"]
+            x = np.power(((size + 1.0) ** e - 1) * u + 1, 1 / e)
+        rank = np.minimum(x.astype(np.int64), size)
+        keys = lo + ((rank - 1) * KEY_SCATTER_PRIME) % size
+
+        if spec["kind"] == "heavy_tail":
+            uniform = self.rng.random(n) >= spec["mix"]
+            keys[uniform] = self.rng.integers(lo, hi + 1, int(uniform.sum()))
+        return keys
+
+    def _fk(self, column: str, lo: int, hi: int) -> int:
+        if column not in self.key_distributions:
+            return random.randint(lo, hi)
+        return int(self._fk_batch(column, lo, hi, 1)[0])
+
+    # Key space: parent ids by row position, foreign keys sampled from the parents
+    def _next_rows(self, n: int) -> slice:
+        rows = slice(self._row_pos, self._row_pos + n)
+        self._row_pos += n
+        return rows
+
+    def _parent_batch(self, column: str, n: int) -> np.ndarray:
+        ks = self.key_space
+        if column == "customer_id":
+            return ks.customer_id(self._fk_batch(column, 0, ks.n_customers - 1, n))
+        return ks.order_id(self._fk_batch(column, 0, ks.n_orders - 1, n))
+
+    def _parent(self, column: str) -> int:
+        ks = self.key_space
+        if column == "customer_id":
+            return int(ks.customer_id(self._fk(column, 0, ks.n_customers - 1)))
+        return int(ks.order_id(self._fk(column, 0, ks.n_orders - 1)))
+
+    def _variant_batch(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        # (product_id, variant_id) of existing variants; product_id sets the distribution
+        idx = self._fk_batch("product_id", 0, self.key_space.n_variants - 1, n)
+        return self.key_space.variant_product_id(idx), self.key_space.variant_id(idx)
+
+    def _variant(self) -> tuple[int, int]:
+        i = self._fk("product_id", 0, self.key_space.n_variants - 1)
+        return int(self.key_space.variant_product_id(i)), int(self.key_space.variant_id(i))
+
+    def _sql_fk(self, column: str, lo: int, hi: int) -> str:
+        spec = self.key_distributions.get(column, {"kind": "uniform"})
+        return _sql_key(spec, lo, hi)
+
+    def _hex_batch(self, prefix: str, digits: int, n: int) -> np.ndarray:
+        # uppercase hex tokens, e.g. SKU-1A2B3C4D, without a uuid4 per row
+        return np.char.mod(f"{prefix}%0{digits}X", self.rng.integers(0, 16**digits, n, dtype=np.uint64))
+
+    # Faker value pools
+    def _pool(self, provider: str) -> np.ndarray | None:
+        size = self.pool_sizes.get(provider)
+        if not size:
+            return None
+
+        key = (FAKER_LOCALE, FAKER_VERSION, self.pool_seed, provider, size)
+        pool = _FAKER_POOLS.get(key)
+        if pool is not None:
+            return pool
+
+        path = None
+        if self.pool_cache_dir:
+            seed_tag = "random" if self.pool_seed is None else self.pool_seed
+            path = os.path.join(
+                self.pool_cache_dir,
+                f"faker_{FAKER_LOCALE}_{FAKER_VERSION}_{seed_tag}_{provider}_{size}.npy",
+            )
+            if os.path.exists(path):
+                pool = np.load(path)
+                self.log.info("Loaded Faker pool %s (%d values) from %s", provider, len(pool), path)
+
+        if pool is None:
+            pool = self._build_pool(provider, size)
+            if path:
+                os.makedirs(self.pool_cache_dir, exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.tmp.npy"
+                np.save(tmp, pool)
+                os.replace(tmp, path)
+
+        _FAKER_POOLS[key] = pool
+        return pool
+
+    def _build_pool(self, provider: str, size: int) -> np.ndarray:
+        """
+        Up to `size` distinct values; providers with a small domain stop early.
+        """
+        fake = Faker(FAKER_LOCALE)
+        fake.add_provider(Provider)
+        if self.pool_seed is not None:
+            fake.seed_instance(self.pool_seed)
+        make = getattr(fake, provider)
+
+        # faker_commerce draws from the global `random`: seed it for the pool and restore
+        # it afterwards so building a pool doesn't shift the seeded row stream
+        state = random.getstate()
+        if self.pool_seed is not None:
+            random.seed(self.pool_seed)
+        values: dict[str, None] = {}
+        attempts = 0
+        try:
+            while len(values) < size and attempts < size * 3:
+                values[make()] = None
+                attempts += 1
+        finally:
+            random.setstate(state)
+
+        self.log.info("Built Faker pool %s: %d distinct values", provider, len(values))
+        return np.array(list(values))
+
+    def warm_pools(self) -> None:
+        for provider in self.pool_sizes:
+            self._pool(provider)
+
+    def _fake(self, provider: str) -> str:
+        pool = self._pool(provider)
+        if pool is None:
+            return getattr(self.fake, provider)()
+        return str(pool[random.randrange(len(pool))])
+
+    def _fake_batch(self, provider: str, n: int) -> np.ndarray:
+        pool = self._pool(provider)
+        if pool is None:
+            make = getattr(self.fake, provider)
+            return np.array([make() for _ in range(n)])
+        return pool[self.rng.integers(0, len(pool), n)]
+
     def _audit(self) -> dict:
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         return {
             "_ingested_at": now,
             "_source": "faker_seed_copy_csv",
@@ -107,6 +994,21 @@ class BronzeSeeder(LoggingMixin):
             "_deleted": False,
         }
 
+    def _audit_batch(self, n: int) -> list[np.ndarray]:
+        """
+        Audit columns for a whole chunk: one timestamp and one batch id per chunk.
+        datetime64 has no zone, so the timestamp is naive UTC, as both COPY formats read it.
+        """
+        now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "us")
+        return [
+            np.full(n, now),                      # _ingested_at
+            np.full(n, "faker_seed_copy_csv"),    # _source
+            np.full(n, str(uuid.uuid4())),        # _batch_id
+            np.full(n, "I"),                      # _op
+            np.full(n, now),                      # _ts
+            np.zeros(n, dtype=bool),              # _deleted
+        ]
+
     # Schema checks
     def check_tables_exist(self) -> None:
         missing: list[str] = []
@@ -123,48 +1025,229 @@ class BronzeSeeder(LoggingMixin):
                 "Run create_bronze_tables DAG first."
             )
 
-    # COPY CSV loader
-    def _copy_table(self, table: str, columns: list[str], row_generator) -> None:
+    # COPY loader (CSV or binary)
+    def _column_types(self, table: str, columns: list[str]) -> list[str]:
+        """
+        Declared types of the target columns, e.g. 'bigint', 'numeric(12,2)'.
+        """
+        self.cur.execute(
+            """
+            SELECT attname, format_type(atttypid, atttypmod)
+            FROM pg_attribute
+            WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+            """,
+            (table,),
+        )
+        declared = dict(self.cur.fetchall())
+        missing = [c for c in columns if c not in declared]
+        if missing:
+            raise RuntimeError(f"Columns {missing} not found on {table}")
+        return [declared[c] for c in columns]
+
+    def _copy_table(
+        self,
+        table: str,
+        columns: list[str],
+        row_generator,
+        batch_generator=None,
+        rows: int | None = None,
+        offset: int = 0,
+    ) -> None:
         self.cur.execute("SELECT to_regclass(%s);", (table,))
         if self.cur.fetchone()[0] is None:
             raise RuntimeError(f"Table {table} does not exist in this connection")
 
-        total = self.rows_per_table
+        if rows is None:
+            rows = self.table_rows[table]
+        self._row_pos = offset
+
+        columnar = self.generation_mode == "columnar" and batch_generator is not None
+        self.log.info(
+            "Starting COPY %s into %s (rows=%d, chunk=%d, mode=%s)",
+            self.copy_format.upper(), table, rows, self.chunk_size,
+            "columnar" if columnar else "row",
+        )
+
+        col_list = ", ".join(columns)
+        blocks = self._generate_blocks(
+            table,
+            rows,
+            row_generator,
+            batch_generator if columnar else None,
+        )
+
+        cache_path = self._dataset_cache_path(table, columns, rows, offset)
+        if cache_path and os.path.exists(cache_path):
+            self.log.info("%s: streaming cached dataset %s", table, cache_path)
+            blocks = self._read_cached_blocks(cache_path)
+            columnar = True
+        elif cache_path:
+            # cached data must depend only on the cache key, not on earlier tables' draws
+            self._seed_rngs(int(np.random.SeedSequence([self.seed, zlib.crc32(table.encode()), offset]).generate_state(1)[0]))
+            blocks = self._write_cached_blocks(blocks, cache_path, columns, columnar)
+
+        if self.copy_format == "binary":
+            encoder = BinaryCopyEncoder(self._column_types(table, columns))
+            encode = encoder.encode_batch if columnar else encoder.encode_rows
+            payload = chain([PGCOPY_HEADER], map(encode, blocks), [PGCOPY_TRAILER])
+            sql = f"COPY {table} ({col_list}) FROM STDIN WITH (FORMAT binary)"
+        else:
+            if columnar:
+                payload = (self._batch_to_csv(columns, block) for block in blocks)
+            else:
+                payload = map(self._rows_to_csv, blocks)
+            sql = f"COPY {table} ({col_list}) FROM STDIN WITH (FORMAT csv, NULL '')"
+
+        self.cur.copy_expert(sql, CopyStream(payload), size=COPY_READ_SIZE)
+
+    # Dataset cache
+    def _dataset_cache_path(self, table: str, columns: list[str], rows: int, offset: int) -> str | None:
+        if not self.dataset_cache_dir or self.seed is None:
+            return None
+
+        schema = list(zip(columns, self._column_types(table, columns)))
+        key = json.dumps(
+            dict(
+                version=DATASET_CACHE_VERSION,
+                faker=FAKER_VERSION,
+                schema=schema,
+                table_rows=self.table_rows,
+                generation_mode=self.generation_mode,
+                chunk_size=self.chunk_size,
+                key_distributions=self.key_distributions,
+                pool_size=self.pool_sizes,
+                pool_seed=self.pool_seed,
+            ),
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        name = f"{table}_seed{self.seed}_rows{rows}_off{offset}_{digest}.parquet"
+        return os.path.join(self.dataset_cache_dir, name)
+
+    def _read_cached_blocks(self, path: str) -> Iterator[list]:
+        os.utime(path)  # mark as recently used for eviction
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=STREAM_BLOCK_ROWS):
+            arrays = [col.to_numpy(zero_copy_only=False) for col in batch.columns]
+            yield arrays + self._audit_batch(batch.num_rows)
+
+    def _write_cached_blocks(
+        self,
+        blocks: Iterator[list],
+        path: str,
+        columns: list[str],
+        columnar: bool,
+    ) -> Iterator[list]:
+        """
+        Pass blocks through unchanged while writing their business columns to the cache;
+        the file only appears under its final name once every block was produced.
+        """
+        names = columns[: len(columns) - len(AUDIT_COLUMNS)]
+        os.makedirs(self.dataset_cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        writer = None
+        try:
+            for block in blocks:
+                arrays = block if columnar else list(zip(*block))
+                part = pa.Table.from_arrays([pa.array(arr) for arr in arrays[: len(names)]], names=names)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp, part.schema, compression="zstd")
+                writer.write_table(part)
+                yield block
+
+            if writer is not None:
+                writer.close()
+                writer = None
+                os.replace(tmp, path)
+                self.log.info("Cached dataset %s (%d bytes)", path, os.path.getsize(path))
+                self._evict_dataset_cache()
+        finally:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _evict_dataset_cache(self) -> None:
+        files = []
+        for name in os.listdir(self.dataset_cache_dir):
+            if name.endswith(".parquet"):
+                path = os.path.join(self.dataset_cache_dir, name)
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.dataset_cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # evicted concurrently by another worker
+                pass
+            total -= size
+            self.log.info("Evicted cached dataset %s", path)
+
+    def _generate_blocks(
+        self,
+        table: str,
+        total: int,
+        row_generator,
+        batch_generator=None,
+    ) -> Iterator[list]:
+        """
+        Lazily generate a table's rows, at most STREAM_BLOCK_ROWS at a time:
+        a list of column arrays when batch_generator is given, else a list of rows.
+        """
         chunk = self.chunk_size
-        self.log.info("Starting COPY CSV into %s (rows=%d, chunk=%d)", table, total, chunk)
 
         for start in range(0, total, chunk):
             count = min(chunk, total - start)
 
-            rows = [row_generator() for _ in range(count)]
-            df = pd.DataFrame(rows, columns=columns)
+            for offset in range(0, count, STREAM_BLOCK_ROWS):
+                n = min(STREAM_BLOCK_ROWS, count - offset)
+                if batch_generator is not None:
+                    yield batch_generator(n)
+                else:
+                    yield [row_generator() for _ in range(n)]
 
-            buf = io.StringIO()
-            df.to_csv(
-                buf,
-                index=False,
-                header=False,
-                quoting=csv.QUOTE_MINIMAL,
-                na_rep="",  # empty field -> NULL
-            )
-            buf.seek(0)
+            self.log.info("%s: inserted %d/%d rows", table, start + count, total)
 
-            col_list = ", ".join(columns)
-            sql = f"COPY {table} ({col_list}) FROM STDIN WITH (FORMAT csv, NULL '')"
-            self.cur.copy_expert(sql, buf)
+    @staticmethod
+    def _rows_to_csv(rows: list[list]) -> bytes:
+        buf = io.StringIO()
+        writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+        for row in rows:
+            # None -> empty field -> NULL
+            writer.writerow(row)
+        return buf.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _batch_to_csv(columns: list[str], arrays: list[np.ndarray]) -> bytes:
+        """
+        Serialize one columnar block to CSV with pyarrow (no per-row Python work).
+        Naive datetime64 columns hold UTC and are written with a zone, so the server
+        does not read them in its session TimeZone.
+        """
+        batch = pa.Table.from_arrays(
+            [
+                pa.array(arr, type=pa.timestamp("us", tz="UTC")) if arr.dtype.kind == "M" else pa.array(arr)
+                for arr in arrays
+            ],
+            names=columns,
+        )
+        buf = io.BytesIO()
+        pa_csv.write_csv(batch, buf, pa_csv.WriteOptions(include_header=False))
+        return buf.getvalue()
 
-            self.log.info("%s: inserted %d/%d rows", table, start + count, total)
-    
     # Row generators – all INTEGER-safe
     def gen_customer_row(self) -> list:
         audit = self._audit()
+        customer_id = int(self.key_space.customer_id(self._next_rows(1).start))
         return [
-            random.randint(1, 50_000),                # customer_id
-            self.fake.email(),                        # email
-            self.fake.name(),                         # name
-            random.choice(["SG", "MY", "ID", "TH"]),  # country
+            customer_id,                              # customer_id
+            self._fake("email"),                      # email
+            self._fake("name"),                       # name
+            random.choice(COUNTRIES),                 # country
             self._rand_ts(),                          # created_at
-            random.choice(["active", "inactive"]),    # status
+            random.choice(CUSTOMER_STATUSES),         # status
             audit["_ingested_at"],
             audit["_source"],
             audit["_batch_id"],
@@ -175,11 +1258,12 @@ class BronzeSeeder(LoggingMixin):
 
     def gen_product_row(self) -> list:
         audit = self._audit()
+        product_id = int(self.key_space.product_id(self._next_rows(1).start))
         return [
-            random.randint(1_000, 30_000),                                     # product_id
-            self.fake.ecommerce_name(),                                        # title
-            random.choice(["Electronics", "Accessories", "Audio", "Storage"]), # category
-            self.fake.company(),                                               # brand
+            product_id,                                                        # product_id
+            self._fake("ecommerce_name"),                                      # title
+            random.choice(PRODUCT_CATEGORIES),                                 # category
+            self._fake("company"),                                             # brand
             True,                                                              # active
             self._rand_ts(),                                                   # created_at
             audit["_ingested_at"],
@@ -197,12 +1281,15 @@ class BronzeSeeder(LoggingMixin):
         audit = self._audit()
         price = random.randint(5, 500)       # int
         cost = random.randint(1, price)      # int <= price
+        pos = self._next_rows(1).start
+        variant_id = int(self.key_space.variant_id(pos))
+        product_id = int(self.key_space.variant_product_id(pos))
 
         return [
-            random.randint(2_000, 80_000),         # variant_id
-            random.randint(1_000, 30_000),         # product_id
-            f"SKU-{uuid.uuid4().hex[:8].upper()}", # sku
-            self.fake.ean13(),                     # barcode
+            variant_id,                            # variant_id
+            product_id,                            # product_id
+            f"SKU-{random.getrandbits(32):08X}",   # sku
+            self._fake("ean13"),                   # barcode
             price,                                 # price (int)
             cost,                                  # cost (int)
             True,                                  # active
@@ -220,14 +1307,15 @@ class BronzeSeeder(LoggingMixin):
         """
         audit = self._audit()
         total_amount = random.randint(10, 100_000)            # int amount
+        order_id = int(self.key_space.order_id(self._next_rows(1).start))
 
         return [
-            random.randint(1, 50_000),                        # order_id
+            order_id,                                         # order_id
             random.randint(1, 8),                             # channel_id
-            random.randint(1, 50_000),                        # customer_id
+            self._parent("customer_id"),                      # customer_id
             self._rand_ts(),                                  # order_ts
-            random.choice(["paid", "pending", "cancelled"]),  # status
-            random.choice(["SGD", "MYR", "IDR", "THB"]),      # currency
+            random.choice(ORDER_STATUSES),                    # status
+            random.choice(CURRENCIES),                        # currency
             total_amount,                                     # total_amount (INT)
             audit["_ingested_at"],
             audit["_source"],
@@ -244,12 +1332,11 @@ class BronzeSeeder(LoggingMixin):
         discount = random.randint(0, 5)
         tax = int(unit_price * 0.07)  # integer-ish tax
         line_amount = qty * (unit_price - discount) + tax
-        product_id = random.randint(1, 30_000)
-        variant_id = (product_id * 10) + random.randint(1, 3)
+        product_id, variant_id = self._variant()
         
         return [
-            random.randint(1, 1_000_000),              # order_item_id
-            random.randint(1, 50_000),                 # order_id
+            self._next_rows(1).start + 1,              # order_item_id
+            self._parent("order_id"),                  # order_id
             product_id,                                # product_id
             variant_id,                                # variant_id
             qty,                                       # qty
@@ -271,11 +1358,11 @@ class BronzeSeeder(LoggingMixin):
         amount = random.randint(10, 100_000)  # int amount
 
         return [
-            random.randint(1, 1_000_000),                                   # payment_id
-            random.randint(1, 50_000),                                      # order_id
-            random.choice(["CreditCard", "EWallet", "PayNow", "PayLater"]), # method
+            self._next_rows(1).start + 1,                                   # payment_id
+            self._parent("order_id"),                                       # order_id
+            random.choice(PAYMENT_METHODS),                                 # method
             amount,                                                         # amount
-            random.choice(["paid", "pending", "failed", "refunded"]),       # status
+            random.choice(PAYMENT_STATUSES),                                # status
             self._rand_ts(),                                                # paid_ts
             audit["_ingested_at"],
             audit["_source"],
@@ -288,13 +1375,13 @@ class BronzeSeeder(LoggingMixin):
     def gen_shipment_row(self) -> list:
         audit = self._audit()
         return [
-            random.randint(1, 1_000_000),              # shipment_id
-            random.randint(1, 50_000),                 # order_id
-            self.fake.company(),                       # carrier
-            random.choice(["Standard", "Express"]),    # service
-            f"TRK-{uuid.uuid4().hex[:10].upper()}",    # tracking_no
+            self._next_rows(1).start + 1,              # shipment_id
+            self._parent("order_id"),                  # order_id
+            self._fake("company"),                     # carrier
+            random.choice(SHIPMENT_SERVICES),          # service
+            f"TRK-{random.getrandbits(40):010X}",      # tracking_no
             self._rand_ts(),                           # shipped_ts
-            random.choice(["processing", "shipped"]),  # status
+            random.choice(SHIPMENT_STATUSES),          # status
             audit["_ingested_at"],
             audit["_source"],
             audit["_batch_id"],
@@ -303,160 +1390,524 @@ class BronzeSeeder(LoggingMixin):
             audit["_deleted"],
         ]
 
-    # Main orchestrator
-    def run(self) -> None:
+    # Column-batch generators – same value domains as gen_*_row, one call per chunk
+    def gen_customer_batch(self, n: int) -> list[np.ndarray]:
+        rows = self._next_rows(n)
+        return [
+            self.key_space.customer_id(rows),                        # customer_id
+            self._fake_batch("email", n),                            # email
+            self._fake_batch("name", n),                             # name
+            self._choice_batch(COUNTRIES, n),                        # country
+            self._rand_ts_batch(n),                                  # created_at
+            self._choice_batch(CUSTOMER_STATUSES, n),                # status
+        ] + self._audit_batch(n)
+
+    def gen_product_batch(self, n: int) -> list[np.ndarray]:
+        rows = self._next_rows(n)
+        return [
+            self.key_space.product_id(rows),                                       # product_id
+            self._fake_batch("ecommerce_name", n),                                 # title
+            self._choice_batch(PRODUCT_CATEGORIES, n),                             # category
+            self._fake_batch("company", n),                                        # brand
+            np.ones(n, dtype=bool),                                                # active
+            self._rand_ts_batch(n),                                                # created_at
+        ] + self._audit_batch(n)
+
+    def gen_variant_batch(self, n: int) -> list[np.ndarray]:
+        price = self.rng.integers(5, 501, n)        # int
+        cost = self.rng.integers(1, price + 1)      # int <= price
+        rows = self._next_rows(n)
+
+        return [
+            self.key_space.variant_id(rows),                     # variant_id
+            self.key_space.variant_product_id(rows),             # product_id
+            self._hex_batch("SKU-", 8, n),                       # sku
+            self._fake_batch("ean13", n),                        # barcode
+            price,                                               # price (int)
+            cost,                                                # cost (int)
+            np.ones(n, dtype=bool),                              # active
+        ] + self._audit_batch(n)
+
+    def gen_order_batch(self, n: int) -> list[np.ndarray]:
+        rows = self._next_rows(n)
+        return [
+            self.key_space.order_id(rows),                             # order_id
+            self.rng.integers(1, 9, n),                                # channel_id
+            self._parent_batch("customer_id", n),                     # customer_id
+            self._rand_ts_batch(n),                                    # order_ts
+            self._choice_batch(ORDER_STATUSES, n),                     # status
+            self._choice_batch(CURRENCIES, n),                         # currency
+            self.rng.integers(10, 100_001, n),                         # total_amount (INT)
+        ] + self._audit_batch(n)
+
+    def gen_order_item_batch(self, n: int) -> list[np.ndarray]:
+        qty = self.rng.integers(1, 6, n)
+        unit_price = self.rng.integers(5, 501, n)
+        discount = self.rng.integers(0, 6, n)
+        tax = (unit_price * 0.07).astype(np.int64)  # integer-ish tax
+        line_amount = qty * (unit_price - discount) + tax
+        product_id, variant_id = self._variant_batch(n)
+        rows = self._next_rows(n)
+
+        return [
+            np.arange(rows.start, rows.stop) + 1,      # order_item_id
+            self._parent_batch("order_id", n),         # order_id
+            product_id,                                # product_id
+            variant_id,                                # variant_id
+            qty,                                       # qty
+            unit_price,                                # unit_price
+            discount,                                  # discount
+            tax,                                       # tax
+            line_amount,                               # line_amount
+            self._rand_ts_batch(n),                    # create_at
+        ] + self._audit_batch(n)
+
+    def gen_payment_batch(self, n: int) -> list[np.ndarray]:
+        rows = self._next_rows(n)
+        return [
+            np.arange(rows.start, rows.stop) + 1,                                   # payment_id
+            self._parent_batch("order_id", n),                                      # order_id
+            self._choice_batch(PAYMENT_METHODS, n),                                 # method
+            self.rng.integers(10, 100_001, n),                                      # amount
+            self._choice_batch(PAYMENT_STATUSES, n),                                # status
+            self._rand_ts_batch(n),                                                 # paid_ts
+        ] + self._audit_batch(n)
+
+    def gen_shipment_batch(self, n: int) -> list[np.ndarray]:
+        rows = self._next_rows(n)
+        return [
+            np.arange(rows.start, rows.stop) + 1,                # shipment_id
+            self._parent_batch("order_id", n),                   # order_id
+            self._fake_batch("company", n),                      # carrier
+            self._choice_batch(SHIPMENT_SERVICES, n),            # service
+            self._hex_batch("TRK-", 10, n),                      # tracking_no
+            self._rand_ts_batch(n),                              # shipped_ts
+            self._choice_batch(SHIPMENT_STATUSES, n),            # status
+        ] + self._audit_batch(n)
+
+    def _seed_table(self, table: str, offset: int = 0, rows: int | None = None) -> None:
+        """
+        Load rows [offset, offset + rows) of a table; the whole table by default.
+        """
+        if rows is None:
+            rows = self.table_rows[table]
+
+        if self.engine == "generate_series":
+            self._insert_series(table, offset, rows)
+            return
+
+        name = BRONZE_GENERATORS[table]
+        self._copy_table(
+            table,
+            BRONZE_COLUMNS[table],
+            getattr(self, f"gen_{name}_row"),
+            getattr(self, f"gen_{name}_batch"),
+            rows=rows,
+            offset=offset,
+        )
+
+    def _insert_series(self, table: str, offset: int, rows: int) -> None:
+        """
+        Server-side load: a single INSERT ... SELECT FROM generate_series() for the
+        table (or, under workers > 1, for this slice). No rows cross the wire.
+        """
+        self.cur.execute("SELECT to_regclass(%s);", (table,))
+        if self.cur.fetchone()[0] is None:
+            raise RuntimeError(f"Table {table} does not exist in this connection")
+
+        if self.seed is not None:
+            # setseed() takes [-1, 1]; seed per table so the result doesn't depend on order
+            state = np.random.SeedSequence([self.seed, BRONZE_TABLES.index(table)]).generate_state(1)[0]
+            self.cur.execute("SELECT setseed(%s);", (float(state) / 2**32,))
+
+        select = series_selects(self._sql_fk, self.table_rows)[table]
+        sql = f"INSERT INTO {table} ({', '.join(BRONZE_COLUMNS[table])}) {select}"
+        self.log.info("Starting generate_series insert into %s (rows=%d, offset=%d)", table, rows, offset)
+        self.cur.execute(sql, {"rows": rows, "offset": offset, "batch_id": str(uuid.uuid4())})
+        self.log.info("%s: inserted %d rows", table, self.cur.rowcount)
+
+    # Parallel seeding
+    def _settings(self) -> dict:
+        """
+        Constructor arguments a worker needs to rebuild an equivalent seeder.
+        """
+        return dict(
+            rows_per_table=self.rows_per_table,
+            scale_factor=self.scale_factor,
+            chunk_size=self.chunk_size,
+            generation_mode=self.generation_mode,
+            copy_format=self.copy_format,
+            engine=self.engine,
+            key_distributions=self.key_distributions,
+            pool_size=self.pool_sizes,
+            pool_cache_dir=self.pool_cache_dir,
+            pool_seed=self.pool_seed,
+            dataset_cache_dir=self.dataset_cache_dir,
+            dataset_cache_max_bytes=self.dataset_cache_max_bytes,
+            fast_load=self.fast_load,
+        )
+
+    def _plan_slices(self, run_id: str) -> list[SeedSlice]:
+        """
+        Split every table into disjoint row ranges of at most slice_rows rows.
+        Each slice gets its own deterministic RNG seed.
+        """
+        tasks: list[SeedSlice] = []
+        for t, table in enumerate(BRONZE_TABLES):
+            total = self.table_rows[table]
+            n_slices = max(math.ceil(total / self.slice_rows), 1) if self.slice_rows else 1
+            two_phase = self.commit_policy == "all_or_nothing" or n_slices > 1
+
+            offset = 0
+            for i in range(n_slices):
+                rows = total // n_slices + (1 if i < total % n_slices else 0)
+                seed = None
+                if self.seed is not None:
+                    seed = int(np.random.SeedSequence([self.seed, t, i]).generate_state(1)[0])
+                gid = f"{PREPARED_GID_PREFIX}:{run_id}:{table}:{i}" if two_phase else None
+                tasks.append(SeedSlice(table, i, offset, rows, seed, gid))
+                offset += rows
+        return tasks
+
+    def _finish_prepared(self, gids: list[str], commit: bool) -> None:
+        verb = "COMMIT PREPARED" if commit else "ROLLBACK PREPARED"
+        for gid in gids:
+            self.cur.execute(f"{verb} %s", (gid,))
+        if gids:
+            self.log.info("%s for %d slice transaction(s)", verb, len(gids))
+
+    def _rollback_stale_prepared(self) -> None:
+        self.cur.execute(
+            "SELECT gid FROM pg_prepared_xacts WHERE gid LIKE %s AND database = current_database()",
+            (f"{PREPARED_GID_PREFIX}:%",),
+        )
+        stale = [row[0] for row in self.cur.fetchall()]
+        if stale:
+            self.log.warning("Rolling back %d stale prepared seed transaction(s)", len(stale))
+            self._finish_prepared(stale, commit=False)
+
+    def _run_parallel(self) -> None:
+        """
+        Seed tables and table slices concurrently, one connection per slice.
+        """
+        run_id = uuid.uuid4().hex[:12]
+        tasks = self._plan_slices(run_id)
+        two_phase = [task for task in tasks if task.gid]
+
+        # coordinator connection only issues COMMIT/ROLLBACK PREPARED from here on
+        self.conn.rollback()
+        self.conn.autocommit = True
+        self._rollback_stale_prepared()
+
+        if two_phase:
+            self.cur.execute("SHOW max_prepared_transactions;")
+            limit = int(self.cur.fetchone()[0])
+            if limit < len(two_phase):
+                raise RuntimeError(
+                    f"{len(two_phase)} slices need prepared transactions but "
+                    f"max_prepared_transactions={limit}. Raise it on the server, "
+                    "or use commit_policy='per_table' without slice_rows."
+                )
+
+        self.log.info(
+            "Parallel seeding run %s: %d slice(s) across %d table(s), workers=%d, policy=%s",
+            run_id, len(tasks), len(BRONZE_TABLES), self.workers, self.commit_policy,
+        )
+
+        prepared: dict[str, list[str]] = {table: [] for table in BRONZE_TABLES}
+        failed: dict[SeedSlice, BaseException] = {}
+        all_or_nothing = self.commit_policy == "all_or_nothing"
+
+        # build pools once here; forked workers inherit them instead of calling Faker
+        self.warm_pools()
+
+        # fork: DAG modules are not importable by name, so spawn/forkserver can't rebuild them
+        pool = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(tasks)),
+            mp_context=multiprocessing.get_context("fork"),
+        )
         try:
-            # 1. Ensure tables exist
-            self.check_tables_exist()
+            settings = self._settings()
+            futures = {pool.submit(_seed_slice_worker, settings, task): task for task in tasks}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    task = futures[future]
+                    if future.cancelled():
+                        continue
+                    if future.exception() is not None:
+                        failed[task] = future.exception()
+                        self.log.error("%s slice %d failed: %s", task.table, task.index, failed[task])
+                        continue
+                    self.log.info("%s slice %d: loaded %d rows", task.table, task.index, task.rows)
+                    if task.gid:
+                        prepared[task.table].append(task.gid)
 
-            # Extra explicit check
-            self.cur.execute("SELECT to_regclass('bronze.customers_raw');")
-            exists = self.cur.fetchone()[0]
-            self.log.info("Pre-COPY to_regclass('bronze.customers_raw') = %s", exists)
+                # stop queued slices; running ones still finish and are collected above
+                if failed and all_or_nothing:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
-            # 2. Seed all tables
-            self._copy_table(
-                "bronze.customers_raw",
-                [
-                    "customer_id",
-                    "email",
-                    "name",
-                    "country",
-                    "created_at",
-                    "status",
-                    "_ingested_at",
-                    "_source",
-                    "_batch_id",
-                    "_op",
-                    "_ts",
-                    "_deleted",
-                ],
-                self.gen_customer_row,
-            )
+        # every slice that reached PREPARE is committed or rolled back below
+        failed_tables = {task.table for task in failed}
+        if all_or_nothing:
+            gids = [gid for table_gids in prepared.values() for gid in table_gids]
+            self._finish_prepared(gids, commit=not failed)
+        else:
+            for table in BRONZE_TABLES:
+                self._finish_prepared(prepared[table], commit=table not in failed_tables)
 
-            self._copy_table(
-                "bronze.products_raw",
-                [
-                    "product_id",
-                    "title",
-                    "category",
-                    "brand",
-                    "active",
-                    "created_at",
-                    "_ingested_at",
-                    "_source",
-                    "_batch_id",
-                    "_op",
-                    "_ts",
-                    "_deleted",
-                ],
-                self.gen_product_row,
-            )
-            
-            self._copy_table(
-                "bronze.product_variants_raw",
-                [
-                    "variant_id",
-                    "product_id",
-                    "sku",
-                    "barcode",
-                    "price",
-                    "cost",
-                    "active",
-                    "_ingested_at",
-                    "_source",
-                    "_batch_id",
-                    "_op",
-                    "_ts",
-                    "_deleted",
-                ],
-                self.gen_variant_row,
+        if failed:
+            raise RuntimeError(
+                f"Parallel seeding failed for {sorted(failed_tables)} "
+                f"(commit_policy={self.commit_policy}); first error: {next(iter(failed.values()))!r}"
             )
 
-            self._copy_table(
-                "bronze.orders_raw",
-                [
-                    "order_id",
-                    "channel_id",
-                    "customer_id",
-                    "order_ts",
-                    "status",
-                    "currency",
-                    "total_amount",
-                    "_ingested_at",
-                    "_source",
-                    "_batch_id",
-                    "_op",
-                    "_ts",
-                    "_deleted",
-                ],
-                self.gen_order_row,
-            )
+        self.log.info("✅ Parallel bronze seeding completed successfully (run %s).", run_id)
 
-            self._copy_table(
-                "bronze.order_items_raw",
-                [
-                    "order_item_id",
-                    "order_id",
-                    "product_id",
-                    "variant_id",
-                    "qty",
-                    "unit_price",
-                    "discount",
-                    "tax",
-                    "line_amount",
-                    "created_at",
-                    "_ingested_at",
-                    "_source",
-                    "_batch_id",
-                    "_op",
-                    "_ts",
-                    "_deleted",
-                ],
-                self.gen_order_item_row,
+    # Checkpointed seeding
+    def _ensure_checkpoint_tables(self) -> None:
+        self.cur.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {SEED_RUNS_TABLE} (
+                run_id      TEXT PRIMARY KEY,
+                config      JSONB NOT NULL,
+                started_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+                finished_at TIMESTAMPTZ
+            );
+            CREATE TABLE IF NOT EXISTS {SEED_CHECKPOINTS_TABLE} (
+                run_id       TEXT NOT NULL REFERENCES {SEED_RUNS_TABLE} (run_id),
+                table_name   TEXT NOT NULL,
+                chunk_offset BIGINT NOT NULL,
+                rows         INTEGER NOT NULL,
+                rng_seed     BIGINT NOT NULL,
+                committed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                PRIMARY KEY (run_id, table_name, chunk_offset)
+            );
+            """
+        )
+        self.conn.commit()
+
+    def _checkpoint_config(self) -> dict:
+        """
+        Everything that decides which rows a chunk contains; a resume must match it.
+        """
+        return dict(
+            table_rows=self.table_rows,
+            chunk_size=self.chunk_size,
+            generation_mode=self.generation_mode,
+            copy_format=self.copy_format,
+            engine=self.engine,
+            seed=self.seed,
+            key_distributions=self.key_distributions,
+            pool_size=self.pool_sizes,
+            pool_seed=self.pool_seed,
+            dataset_cache=bool(self.dataset_cache_dir),
+        )
+
+    def _register_run(self) -> int:
+        """
+        Create the run record, or check a resumed run against it. Returns the run's
+        base seed for chunk RNGs (drawn once when the run has no explicit seed).
+        """
+        config = self._checkpoint_config()
+        self.cur.execute(f"SELECT config FROM {SEED_RUNS_TABLE} WHERE run_id = %s FOR UPDATE", (self.run_id,))
+        row = self.cur.fetchone()
+
+        if row is None:
+            config["base_seed"] = self.seed if self.seed is not None else random.SystemRandom().getrandbits(32)
+            self.cur.execute(
+                f"INSERT INTO {SEED_RUNS_TABLE} (run_id, config) VALUES (%s, %s)",
+                (self.run_id, json.dumps(config)),
             )
+            self.log.info("Checkpointed seeding run %s started", self.run_id)
+        else:
+            stored = row[0]
+            base_seed = stored.pop("base_seed")
+            if stored != json.loads(json.dumps(config)):
+                raise RuntimeError(
+                    f"Seeding run {self.run_id} was started with a different configuration: "
+                    f"{stored} != {config}"
+                )
+            config["base_seed"] = base_seed
+            self.log.info("Resuming checkpointed seeding run %s", self.run_id)
 
-            self._copy_table(
-                "bronze.payments_raw",
-                [
-                    "payment_id",
-                    "order_id",
-                    "method",
-                    "amount",
-                    "status",
-                    "paid_ts",
-                    "_ingested_at",
-                    "_source",
-                    "_batch_id",
-                    "_op",
-                    "_ts",
-                    "_deleted",
-                ],
-                self.gen_payment_row,
+        self.conn.commit()
+        return int(config["base_seed"])
+
+    def _reseed(self, seed: int) -> None:
+        # every RNG a chunk draws from; _insert_series derives setseed() from self.seed
+        self.seed = seed
+        self._seed_rngs(seed)
+
+    def _run_checkpointed(self) -> None:
+        base_seed = self._register_run()
+
+        for t, table in enumerate(BRONZE_TABLES):
+            self.cur.execute(
+                f"SELECT chunk_offset FROM {SEED_CHECKPOINTS_TABLE} WHERE run_id = %s AND table_name = %s",
+                (self.run_id, table),
             )
+            done = {row[0] for row in self.cur.fetchall()}
+            total = self.table_rows[table]
+            if done:
+                self.log.info("%s: %d chunk(s) already committed, skipping them", table, len(done))
+
+            for offset in range(0, total, self.chunk_size):
+                if offset in done:
+                    continue
+                rows = min(self.chunk_size, total - offset)
+                rng_seed = int(np.random.SeedSequence([base_seed, t, offset]).generate_state(1)[0])
+                self._reseed(rng_seed)
+                self._seed_table(table, offset, rows)
+                self.cur.execute(
+                    f"""
+                    INSERT INTO {SEED_CHECKPOINTS_TABLE} (run_id, table_name, chunk_offset, rows, rng_seed)
+                    VALUES (%s, %s, %s, %s, %s)
+                    """,
+                    (self.run_id, table, offset, rows, rng_seed),
+                )
+                self.conn.commit()
 
-            self._copy_table(
-                "bronze.shipments_raw",
-                [
-                    "shipment_id",
-                    "order_id",
-                    "carrier",
-                    "service",
-                    "tracking_no",
-                    "shipped_ts",
-                    "status",
-                    "_ingested_at",
-                    "_source",
-                    "_batch_id",
-                    "_op",
-                    "_ts",
-                    "_deleted",
-                ],
-                self.gen_shipment_row,
+        self.cur.execute(
+            f"UPDATE {SEED_RUNS_TABLE} SET finished_at = coalesce(finished_at, now()) WHERE run_id = %s",
+            (self.run_id,),
+        )
+        self.conn.commit()
+        self.log.info("✅ Checkpointed bronze seeding run %s completed.", self.run_id)
+
+    # Fast-load mode
+    @contextmanager
+    def _timed(self, phase: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = time.perf_counter() - started
+            self.log.info("Phase %s took %.2fs", phase, self.timings[phase])
+
+    def _prepare_fast_load(self) -> tuple[list[tuple[str, str]], list[str]]:
+        """
+        Drop secondary indexes (constraint-backed ones stay) and optionally switch the
+        bronze tables to UNLOGGED. Returns what _finish_fast_load has to restore.
+        """
+        self.cur.execute(
+            """
+            SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            WHERE i.indrelid = ANY(%s::regclass[])
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+            """,
+            (BRONZE_TABLES,),
+        )
+        # pg_get_indexdef renders a partitioned parent's index as "ON ONLY <parent>", which
+        # would re-create it invalid and without the partition indexes dropped with it
+        indexes = [
+            (name, definition.replace(" ON ONLY ", " ON ", 1)) for name, definition in self.cur.fetchall()
+        ]
+        for name, definition in indexes:
+            self.log.info("Deferring index %s: %s", name, definition)
+            self.cur.execute(f"DROP INDEX {name}")
+
+        switched: list[str] = []
+        if self.unlogged:
+            # partitioned parents have no storage of their own: switch their partitions
+            self.cur.execute(
+                """
+                SELECT c.oid::regclass::text
+                FROM pg_class c
+                WHERE (c.oid = ANY(%s::regclass[])
+                       OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = ANY(%s::regclass[])))
+                  AND c.relkind = 'r'
+                  AND c.relpersistence = 'p'
+                """,
+                (BRONZE_TABLES, BRONZE_TABLES),
             )
+            switched = [row[0] for row in self.cur.fetchall()]
+            for table in switched:
+                self.cur.execute(f"ALTER TABLE {table} SET UNLOGGED")
 
+        self.conn.commit()
+        self.log.info("Fast load: dropped %d index(es), %d table(s) UNLOGGED", len(indexes), len(switched))
+        return indexes, switched
+
+    def _finish_fast_load(self, indexes: list[tuple[str, str]], switched: list[str]) -> None:
+        """
+        Restore what _prepare_fast_load changed, even after a failed load.
+        """
+        self.conn.rollback()  # a failed load leaves the transaction aborted
+
+        # back to LOGGED first: SET LOGGED rewrites the heap and every index on it
+        with self._timed("set_logged"):
+            for table in switched:
+                self.cur.execute(f"ALTER TABLE {table} SET LOGGED")
+                self.conn.commit()
+
+        with self._timed("create_indexes"):
+            for name, definition in indexes:
+                self.cur.execute(definition)
+                self.conn.commit()
+                self.log.info("Re-created index %s", name)
+
+        with self._timed("analyze"):
+            for table in BRONZE_TABLES:
+                self.cur.execute(f"ANALYZE {table}")
             self.conn.commit()
-            self.log.info("✅ Bronze seeding completed successfully (integer-safe).")
+
+    def _seed_all(self) -> None:
+        if self.run_id:
+            self._ensure_checkpoint_tables()
+            self._run_checkpointed()
+            return
+
+        if self.workers > 1:
+            self._run_parallel()
+            return
+
+        for table in BRONZE_TABLES:
+            self._seed_table(table)
+
+        self.conn.commit()
+        self.log.info("✅ Bronze seeding completed successfully (integer-safe).")
+
+    # Main orchestrator
+    def run(self) -> None:
+        try:
+            # 1. Ensure tables exist
+            self.check_tables_exist()
+
+            # Extra explicit check
+            self.cur.execute("SELECT to_regclass('bronze.customers_raw');")
+            exists = self.cur.fetchone()[0]
+            self.log.info("Pre-COPY to_regclass('bronze.customers_raw') = %s", exists)
+
+            if self.scale_factor:
+                self.log.info(
+                    "Scale factor %s (seed=%s): %s rows in total, %s",
+                    self.scale_factor, self.seed, f"{sum(self.table_rows.values()):,}", self.table_rows,
+                )
+
+            # 2. Seed all tables
+            if not self.fast_load:
+                self._seed_all()
+                return
+
+            with self._timed("prepare"):
+                indexes, switched = self._prepare_fast_load()
+            try:
+                with self._timed("load"):
+                    self._seed_all()
+            finally:
+                if self.conn.autocommit:  # left on by the parallel coordinator
+                    self.conn.autocommit = False
+                self._finish_fast_load(indexes, switched)
+                self.log.info(
+                    "Fast-load timings: %s",
+                    ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in self.timings.items()),
+                )
 
         except Exception:
             self.log.exception("❌ Error while seeding bronze data, rolling back.")
@@ -477,7 +1928,40 @@ def check_bronze_tables_callable(**context):
 
 
 def seed_bronze_callable(**context):
-    seeder = BronzeSeeder()
+    params = context.get("params") or {}
+
+    # checkpointed runs default to the DAG run id, so task retries resume the same run
+    run_id = None
+    if params.get("checkpoint"):
+        run_id = params.get("run_id") or context["run_id"]
+
+    # the trigger form may hand numbers over as strings; pool_size may also be a dict
+    slice_rows = params.get("slice_rows")
+    seed = params.get("seed")
+    pool_size = params.get("pool_size", DEFAULT_POOL_SIZE)
+    if pool_size is not None and not isinstance(pool_size, dict):
+        pool_size = int(pool_size)
+
+    seeder = BronzeSeeder(
+        rows_per_table=int(params.get("rows_per_table", DEFAULT_ROWS_PER_TABLE)),
+        chunk_size=int(params.get("chunk_size", DEFAULT_CHUNK_SIZE)),
+        generation_mode=params.get("generation_mode", DEFAULT_GENERATION_MODE),
+        seed=int(seed) if seed is not None else None,
+        copy_format=params.get("copy_format", DEFAULT_COPY_FORMAT),
+        workers=int(params.get("workers", DEFAULT_WORKERS)),
+        slice_rows=int(slice_rows) if slice_rows else None,
+        commit_policy=params.get("commit_policy", DEFAULT_COMMIT_POLICY),
+        engine=params.get("engine", DEFAULT_SEED_ENGINE),
+        pool_size=pool_size,
+        pool_cache_dir=params.get("pool_cache_dir"),
+        scale_factor=params.get("scale_factor"),
+        key_distributions=params.get("key_distributions"),
+        run_id=run_id,
+        dataset_cache_dir=params.get("dataset_cache_dir"),
+        dataset_cache_max_bytes=int(params.get("dataset_cache_max_bytes", DEFAULT_DATASET_CACHE_MAX_BYTES)),
+        fast_load=bool(params.get("fast_load", False)),
+        unlogged=bool(params.get("unlogged", False)),
+    )
     seeder.run()
 
 
@@ -486,8 +1970,33 @@ with DAG(
     start_date=dt(2023, 1, 1),
     schedule=None,
     catchup=False,
+    # a run rolls back every bronze_seed:* prepared transaction left in the database,
+    # which must never be another run's in-flight slices
+    max_active_runs=1,
     default_args=DEFAULT_ARGS,
     tags=["bronze", "seed", "ingestion"],
+    params={
+        "rows_per_table": DEFAULT_ROWS_PER_TABLE,
+        "chunk_size": DEFAULT_CHUNK_SIZE,
+        "generation_mode": DEFAULT_GENERATION_MODE,
+        "seed": None,
+        "copy_format": DEFAULT_COPY_FORMAT,
+        "workers": DEFAULT_WORKERS,
+        "slice_rows": None,
+        "commit_policy": DEFAULT_COMMIT_POLICY,
+        "engine": DEFAULT_SEED_ENGINE,
+        "pool_size": DEFAULT_POOL_SIZE,
+        "pool_cache_dir": None,
+        "scale_factor": None,
+        # e.g. {"product_id": {"kind": "zipf", "s": 1.2}, "customer_id": "heavy_tail"}
+        "key_distributions": {},
+        "checkpoint": False,
+        "run_id": None,
+        "dataset_cache_dir": None,
+        "dataset_cache_max_bytes": DEFAULT_DATASET_CACHE_MAX_BYTES,
+        "fast_load": False,
+        "unlogged": False,
+    },
 ) as dag:
     start = EmptyOperator(task_id="start")
 
@@ -499,6 +2008,7 @@ with DAG(
     seed_bronze = PythonOperator(
         task_id="seed_bronze_copy_from_stdin",  # name kept to match your UI
         python_callable=seed_bronze_callable,
+        outlets=[BRONZE_LAYER],  # triggers the staging DAG
     )
 
     end = EmptyOperator(task_id="end")
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import subprocess
 import logging
 import requests
 from dotenv import load_dotenv
@@ -11,15 +10,21 @@ from airflow import DAG
 from airflow.decorators import task
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.exceptions import AirflowFailException
+from airflow.timetables.assets import AssetOrTimeSchedule
+from airflow.timetables.trigger import CronTriggerTimetable
+
+from common.assets import BRONZE_LAYER, STAGING_LAYER
+from common.dbt_runner import get_runner, run_dbt
+from common.soda_scans import soda_checks, soda_scan_group
 
 # ENV
 load_dotenv()
 
-DBT_PROJECT_DIR = os.getenv("DBT_PROJECT_DIR", "/opt/airflow/include/dbt")
-DBT_PROFILES_DIR = os.getenv("DBT_PROFILES_DIR", "/opt/airflow/include/dbt")
-SODA_CONFIG = os.getenv("SODA_CONFIG", "/opt/airflow/include/soda/soda_config.yml")
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
 
+# one scan per staging table (staging_checks.yml is the older all-tables file)
+STAGING_SCANS = soda_checks("bronze_staging", "staging/staging_*.yml", exclude=("staging_checks.yml",))
+
 # DAG definition
 DEFAULT_ARGS = {
     "owner": "DE-warehouse",
@@ -29,52 +34,55 @@ DEFAULT_ARGS = {
 with DAG(
     dag_id="dag_ingest_scan_dq_staging",
     start_date=datetime(2024, 1, 1),
-    schedule="0 * * * *", # Hourly
+    # Hourly, or as soon as a bronze load lands; the dwh DAG follows on STAGING_LAYER
+    schedule=AssetOrTimeSchedule(
+        timetable=CronTriggerTimetable("0 * * * *", timezone="UTC"), assets=BRONZE_LAYER
+    ),
+    max_active_runs=1,
     catchup=False,
     default_args=DEFAULT_ARGS,
     tags=["staging", "dbt", "soda"],
+    params={
+        "full_refresh": False,  # rebuild staging from all of bronze instead of the delta
+        "slim_run": True,  # only models with changed code or new bronze batches
+    },
 ) as dag:
 
     start = EmptyOperator(task_id="start")
 
+    # SLIM RUN: nothing changed skips the rest of the run (and the downstream layers)
+    @task.short_circuit(ignore_downstream_trigger_rules=True)
+    def select_staging_models(**context) -> list[str]:
+        params = context["params"]
+        full = params.get("full_refresh") or not params.get("slim_run")
+        return get_runner().slim_selection("staging", ["tag:staging"], full=full)
+
     # DBT
     @task
-    def dbt_run_staging():
-        subprocess.run(
-            ["dbt", "run", "--select", "tag:staging"],
-            cwd=DBT_PROJECT_DIR,
-            env={**os.environ, "DBT_PROFILES_DIR": DBT_PROFILES_DIR},
-            check=True,
-        )
+    def dbt_run_staging(models: list[str], **context):
+        # staging models are incremental on bronze _ingested_at
+        full_refresh = ["--full-refresh"] if context["params"].get("full_refresh") else []
+        run_dbt("run", "--select", *models, *full_refresh)
 
     @task
-    def dbt_test_staging():
-        subprocess.run(
-            ["dbt", "test", "--select", "tag:staging"],
-            cwd=DBT_PROJECT_DIR,
-            env={**os.environ, "DBT_PROFILES_DIR": DBT_PROFILES_DIR},
-            check=True,
-        )
+    def dbt_test_staging(models: list[str]):
+        run_dbt("test", "--select", *models)
+
+    # GATE: runs (and returns True) only if the dbt run and tests did not fail; Soda
+    # scans even a failed build, so the branch below checks both
+    @task(trigger_rule="none_failed")
+    def dbt_staging_ok() -> bool:
+        return True
         
-    # SODA CHECKS
-    @task(trigger_rule="all_done")
-    def soda_scan_staging():
-        subprocess.run(
-            [
-                "soda",
-                "scan",
-                "-d",
-                "bronze_staging",
-                "-c",
-                SODA_CONFIG,
-                "/opt/airflow/include/soda/checks/staging_checks.yml",
-            ],
-            check=True,
-        )
+    # SODA CHECKS: per-table scans in parallel, one exit code for the DQ branch below
+    soda_scans, soda_exit = soda_scan_group("soda_scan_staging", STAGING_SCANS, trigger_rule="all_done")
         
     # Branch based on Soda result (TaskFlow-native)
     @task.branch(trigger_rule="all_done")
-    def branch_on_staging_dq(exit_code: int) -> str:
+    def branch_on_staging_dq(exit_code: int, dbt_ok: bool | None) -> str:
+        if not dbt_ok:
+            logging.error("dbt staging run or tests failed")
+            return "run_staging_quarantine"
         if exit_code == 0:
             return "staging_success"
         else:
@@ -83,17 +91,7 @@ with DAG(
     # QUARANTINE PATH (FAIL)
     @task
     def run_staging_quarantine():
-        subprocess.run(
-            [
-                "dbt",
-                "run",
-                "--select",
-                "models/quarantine/staging"
-            ],
-        cwd=DBT_PROJECT_DIR,
-        env={**os.environ, "DBT_PROFILES_DIR": DBT_PROFILES_DIR},
-        check=True,
-    )
+        run_dbt("run", "--select", "models/quarantine/staging")
         
     # SLACK ALERT
     @task.branch(trigger_rule="all_done")
@@ -122,25 +120,34 @@ with DAG(
         )
         
     # Staging OK PATH (SUCCESS)
-    @task
+    @task(outlets=[STAGING_LAYER])
     def staging_success() -> None:
+        # only a tested and checked build becomes the baseline of the next slim run
+        get_runner().save_state("staging")
         logging.info("Staging pipeline completed successfully")
     
     # DAG wiring
-    soda_exit = soda_scan_staging()
-    branch = branch_on_staging_dq(soda_exit)
+    staging_models = select_staging_models()
+    dbt_test = dbt_test_staging(staging_models)
+    dbt_ok = dbt_staging_ok()
+    branch = branch_on_staging_dq(soda_exit, dbt_ok)
     end = EmptyOperator(task_id="end")
 
     # FLOW
     (
         start
-        >> dbt_run_staging()
-        >> dbt_test_staging()
-        >> soda_exit
+        >> staging_models
+        >> dbt_run_staging(staging_models)
+        >> dbt_test
+        >> soda_scans
         >> branch
     )
+    dbt_test >> dbt_ok
 
-    branch >> staging_success() >> end
+    # the STAGING_LAYER event needs the dbt gate too, not only the branch
+    success = staging_success()
+    branch >> success >> end
+    dbt_ok >> success
     
     (
     branch 
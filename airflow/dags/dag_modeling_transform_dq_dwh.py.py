@@ -5,22 +5,41 @@ import subprocess
 import logging
 import requests
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from airflow import DAG
 from airflow.decorators import task
 from airflow.providers.standard.operators.empty import EmptyOperator
-from airflow.utils.trigger_rule import TriggerRule
 from airflow.exceptions import AirflowFailException
 
+from common.assets import DWH_LAYER, STAGING_LAYER
+from common.dbt_runner import get_runner, run_dbt
+from common.dbt_task_group import dbt_model_task_group
+
 # ENV
 load_dotenv()
 
-DBT_PROJECT_DIR = os.getenv("DBT_PROJECT_DIR", "/opt/airflow/include/dbt")
-DBT_PROFILES_DIR = os.getenv("DBT_PROFILES_DIR", "/opt/airflow/include/dbt")
 SODA_CONFIG = os.getenv("SODA_CONFIG", "/opt/airflow/include/soda/soda_config.yml")
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
 
+# Facts build incrementally, and fully once per day (UTC) to pick up dimension changes and
+# deletes the incremental path does not see: the first run of a day without a successful full
+# refresh yet. Runs are asset-triggered, so this goes by the recorded day, not the run's hour.
+
+
+def full_refresh_facts(context, tags) -> bool:
+    if "fact" not in tags:
+        return False
+    last = get_runner().last_full_refresh("dwh")
+    full_refresh = (
+        context["params"].get("full_refresh_facts")
+        or last is None
+        or last < context["dag_run"].start_date.date()
+    )
+    logging.info("Fact build: %s", "full refresh" if full_refresh else "incremental")
+    return full_refresh
+
+
 # DAG definition
 DEFAULT_ARGS = {
     "owner": "DE-warehouse",
@@ -31,85 +50,59 @@ DEFAULT_ARGS = {
 with DAG(
     dag_id="dag_modeling_transform_dq_dwh",
     start_date=datetime(2024, 1, 1),
-    schedule="15 * * * *", # Hourly at minute 15
+    schedule=STAGING_LAYER,  # as soon as staging is built and checked
+    max_active_runs=1,
     catchup=False,
     default_args=DEFAULT_ARGS,
     tags=["dwh", "dbt", "soda"],
+    params={
+        "full_refresh_facts": False,
+        "slim_run": True,  # only models with changed code or new bronze batches
+    },
 ) as dag:
 
     start = EmptyOperator(task_id="start")
 
-    # DIMENSIONS
-    @task
-    def dbt_run_dimensions():
-        subprocess.run(
-            [
-              "dbt",
-              "run",
-              "--project-dir", "/opt/airflow/include/dbt",
-              "--profiles-dir", "/opt/airflow/include/dbt",
-              "--select", "tag:dimension",
-            ],
-             check=True,
-        )
-
-    # FACTS
-    @task
-    def dbt_run_facts():
-        subprocess.run(
-            [
-              "dbt",
-              "run",
-              "--project-dir", "/opt/airflow/include/dbt",
-              "--profiles-dir", "/opt/airflow/include/dbt",
-              "--select", "tag:fact"
-            ],
-            check=True,
-        )
+    # SLIM RUN: nothing changed skips the rest of the run (and the mart layer)
+    @task.short_circuit(ignore_downstream_trigger_rules=True)
+    def select_dwh_models(**context) -> list[str]:
+        full = not context["params"].get("slim_run") or full_refresh_facts(context, ["fact"])
+        return get_runner().slim_selection("dwh", ["tag:dimension", "tag:fact"], full=full)
+
+    # DIMENSIONS + FACTS: one run/test task per model from the dbt manifest, following
+    # ref() edges, so independent dims and facts build in parallel (bounded by DBT_POOL)
+    dwh_models = dbt_model_task_group(
+        "dwh_models",
+        ["dimension", "fact"],
+        full_refresh=full_refresh_facts,
+        select_task_id="select_dwh_models",
+    )
 
-    # TEST
-    @task
-    def dbt_test_dim():
-        subprocess.run(
-            [
-              "dbt",
-              "test",
-              "--project-dir", "/opt/airflow/include/dbt",
-              "--profiles-dir", "/opt/airflow/include/dbt",
-              "--select", "tag:dimension"
-            ],
-            check=True,
-        )
-
-    @task
-    def dbt_test_fact():
-        subprocess.run(
-            [
-              "dbt",
-              "test",
-              "--project-dir", "/opt/airflow/include/dbt",
-              "--profiles-dir", "/opt/airflow/include/dbt",
-              "--select", "tag:fact"
-            ],
-            check=True,
-        )
+    # GATE: runs (and returns True) only if no dbt run/test task failed; Soda scans even
+    # a failed build, so the branch below checks both
+    @task(trigger_rule="none_failed")
+    def dbt_dwh_ok() -> bool:
+        return True
 
     # SODA: DWH CHECKS
     @task(trigger_rule="all_done")
-    def soda_scan_dwh():
-        subprocess.run(
+    def soda_scan_dwh() -> int:
+        # the exit code drives the DQ branch below
+        return subprocess.run(
             [
                 "soda", "scan",
                 "-d", "dwh",
                 "-c", SODA_CONFIG,
                 "/opt/airflow/include/soda/dwh/dwh_checks.yml"
             ],
-            check=True
-        )
+        ).returncode
     
     # BRANCHING (TaskFlow-native)
     @task.branch(trigger_rule="all_done")
-    def branch_on_dwh_dq(exit_code: int) -> str:
+    def branch_on_dwh_dq(exit_code: int, dbt_ok: bool | None) -> str:
+        if not dbt_ok:
+            logging.error("dbt dwh models or tests failed")
+            return "run_dwh_quarantine"
         if exit_code == 0:
             return "dwh_success"
         else:
@@ -118,13 +111,8 @@ with DAG(
     # QUARANTINE PATH (FAIL)
     @task
     def run_dwh_quarantine():
-        cmd = ["dbt", "run", "--select", "tag:quarantine_dwh"]
-        result = subprocess.run(
-            cmd, cwd=DBT_PROJECT_DIR, capture_output=True, text=True
-        )
-        logging.info(result.stdout)
-        if result.returncode != 0:
-            logging.error(result.stderr)
+        result = run_dbt("run", "--select", "tag:quarantine_dwh", check=False)
+        if not result.success:
             raise Exception("dbt quarantine failed")
     
     # SLACK ALERT
@@ -152,27 +140,34 @@ with DAG(
         raise AirflowFailException("DWH data quality violations detected")
 
     # DWH OK PATH (SUCCESS)
-    @task
-    def dwh_success() -> None:
+    @task(outlets=[DWH_LAYER])
+    def dwh_success(**context) -> None:
+        # only a tested and checked build becomes the baseline of the next slim run
+        get_runner().save_state("dwh")
+        if full_refresh_facts(context, ["fact"]):
+            get_runner().save_full_refresh("dwh", context["dag_run"].start_date.date())
         logging.info("DWH pipeline completed successfully")
 
     # DAG wiring
     soda_exit = soda_scan_dwh()
-    branch = branch_on_dwh_dq(soda_exit)
+    dbt_ok = dbt_dwh_ok()
+    branch = branch_on_dwh_dq(soda_exit, dbt_ok)
     end = EmptyOperator(task_id="end")
     
     # Flow
     (
         start
-        >> dbt_run_dimensions()
-        >> dbt_test_dim()
-        >> dbt_run_facts()
-        >> dbt_test_fact()
+        >> select_dwh_models()
+        >> dwh_models
         >> soda_exit
         >> branch
     )
+    dwh_models >> dbt_ok
 
-    branch >> dwh_success() >> end
+    # the DWH_LAYER event and the full-refresh record need the dbt gate too, not only the branch
+    success = dwh_success()
+    branch >> success >> end
+    dbt_ok >> success
     
     (
     branch 
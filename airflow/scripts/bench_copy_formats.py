@@ -0,0 +1,88 @@
+"""
+Benchmark CSV vs binary COPY throughput per bronze table.
+
+Each table is loaded into a temporary clone (LIKE bronze.<table>) once per
+format over the seeder's own connection, and everything is rolled back at
+the end, so the real bronze tables are never touched.
+
+Run inside the Airflow worker container (PG* env vars as for the seeder):
+    python /opt/airflow/scripts/bench_copy_formats.py --rows 200000 --mode columnar
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from importlib.machinery import SourceFileLoader
+
+DAGS_DIR = os.getenv("AIRFLOW_DAGS_DIR", os.path.join(os.path.dirname(__file__), "..", "dags"))
+SEED_DAG_FILE = os.path.join(DAGS_DIR, "dag_data_seed_oltp.py.py")
+
+
+def load_seed_module():
+    # DAG files carry a .py.py suffix, so load by path rather than by import name; their
+    # shared helpers (common/) resolve from the dags folder as under Airflow
+    if DAGS_DIR not in sys.path:
+        sys.path.insert(0, DAGS_DIR)
+    loader = SourceFileLoader("dag_data_seed_oltp", SEED_DAG_FILE)
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(loader.name, loader))
+    loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=100_000, help="rows per table")
+    parser.add_argument("--chunk", type=int, default=50_000, help="chunk size")
+    parser.add_argument("--mode", default="columnar", help="generation mode: row | columnar")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    seed = load_seed_module()
+    seeder = seed.BronzeSeeder(
+        rows_per_table=args.rows,
+        chunk_size=args.chunk,
+        generation_mode=args.mode,
+        seed=args.seed,
+    )
+
+    results = []
+    try:
+        for table in seed.BRONZE_TABLES:
+            clone = "bench_" + table.split(".")[1]
+            seeder.cur.execute(f"CREATE TEMP TABLE {clone} (LIKE {table} INCLUDING DEFAULTS)")
+
+            name = seed.BRONZE_GENERATORS[table]
+            timings = {}
+            for copy_format in seed.COPY_FORMATS:
+                seeder.copy_format = copy_format
+                seeder.cur.execute(f"TRUNCATE {clone}")
+                started = time.perf_counter()
+                seeder._copy_table(
+                    clone,
+                    seed.BRONZE_COLUMNS[table],
+                    getattr(seeder, f"gen_{name}_row"),
+                    getattr(seeder, f"gen_{name}_batch"),
+                    rows=args.rows,
+                )
+                timings[copy_format] = time.perf_counter() - started
+
+            results.append((table, timings))
+    finally:
+        seeder.conn.rollback()
+        seeder._close_connection()
+
+    print(f"\nrows/table={args.rows} chunk={args.chunk} mode={args.mode}")
+    print(f"{'table':<30}{'csv rows/s':>14}{'binary rows/s':>16}{'speedup':>10}")
+    for table, timings in results:
+        csv_rate = args.rows / timings["csv"]
+        binary_rate = args.rows / timings["binary"]
+        print(f"{table:<30}{csv_rate:>14,.0f}{binary_rate:>16,.0f}{binary_rate / csv_rate:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Parse the dbt project and publish manifest.json to DBT_ARTIFACT_DIR.
+
+The dwh DAG builds its per-model tasks from that manifest when the DAG file is parsed,
+and the DAG processor only reads it, so it has to exist before the first DAG parse. Every
+dbt task republishes it after its own parse; run this on deploy (airflow-init does) or
+after changing models to refresh it right away.
+
+Run inside an Airflow container (DBT_* and PG* env vars as for the dbt tasks):
+    python /opt/airflow/scripts/publish_dbt_manifest.py
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+DAGS_DIR = os.getenv("AIRFLOW_DAGS_DIR", os.path.join(os.path.dirname(__file__), "..", "dags"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.parse_args()
+
+    # the runner is a shared DAG helper (common/), resolved from the dags folder as under Airflow
+    if DAGS_DIR not in sys.path:
+        sys.path.insert(0, DAGS_DIR)
+    from common.dbt_runner import DBT_ARTIFACT_DIR, DbtRunner
+
+    DbtRunner().manifest()
+    print(f"dbt manifest published to {os.path.join(DBT_ARTIFACT_DIR, 'manifest.json')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+{#-
+    Day-level incremental marts. The facts build independently, so a mart keeps one watermark
+    per fact it reads (orders_load_ts, items_load_ts, payments_load_ts: each fact's high water
+    at the mart's last build). changed_order_date_keys() lists the order days touched by fact
+    rows re-staged after their own fact's watermark, including late items and payments of
+    older orders, and the mart re-aggregates and replaces just those days (delete+insert on
+    the day column).
+-#}
+{% macro fact_high_water(fact) %}
+    {%- set high_water = none -%}
+    {%- if execute -%}
+        {%- set result = run_query("select max(source_load_ts)::text from " ~ ref(fact)) -%}
+        {%- set high_water = result.columns[0].values()[0] -%}
+    {%- endif -%}
+    {%- if high_water is none -%}
+        null::timestamptz
+    {%- else -%}
+        '{{ high_water }}'::timestamptz
+    {%- endif -%}
+{% endmacro %}
+
+{% macro changed_order_date_keys(orders_since, items_since, payments_since) %}
+    select date_key from {{ ref('fct_orders') }} where source_load_ts > {{ orders_since }}
+    union
+    select ods.date_key
+    from {{ ref('fct_order_items') }} itm
+    join {{ ref('fct_orders') }} ods on ods.order_key = itm.order_key
+    where itm.source_load_ts > {{ items_since }}
+    union
+    select ods.date_key
+    from {{ ref('fct_payments') }} pay
+    join {{ ref('fct_orders') }} ods on ods.order_id = pay.order_id
+    where pay.source_load_ts > {{ payments_since }}
+{% endmacro %}
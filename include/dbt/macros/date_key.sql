@@ -0,0 +1,4 @@
+{#- yyyymmdd integer key of a date/timestamp expression; equals dim_dates.date_sk -#}
+{% macro date_key(expr) %}
+    to_char(({{ expr }})::date, 'YYYYMMDD')::int
+{%- endmacro %}
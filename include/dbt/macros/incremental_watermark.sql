@@ -0,0 +1,23 @@
+{#-
+    Lower bound for an incremental delta read from bronze: the newest `column` value already
+    in {{ this }}, minus a lookback for batches that committed late. Rendered as a literal
+    (not a subquery) so Postgres prunes bronze partitions / uses the BRIN index at plan time.
+    Full refreshes, and targets that predate the column, get -infinity (read everything).
+-#}
+{% macro incremental_watermark(column='_ingested_at', lookback=var('staging_lookback', '15 minutes')) %}
+    {%- set watermark = none -%}
+    {%- if execute and is_incremental() -%}
+        {%- set existing = adapter.get_columns_in_relation(this) | map(attribute='name') | list -%}
+        {%- if column in existing -%}
+            {%- set result = run_query(
+                "select (max(" ~ column ~ ") - interval '" ~ lookback ~ "')::text from " ~ this
+            ) -%}
+            {%- set watermark = result.columns[0].values()[0] -%}
+        {%- endif -%}
+    {%- endif -%}
+    {%- if watermark is none -%}
+        '-infinity'::timestamptz
+    {%- else -%}
+        '{{ watermark }}'::timestamptz
+    {%- endif -%}
+{% endmacro %}
@@ -0,0 +1,8 @@
+{#-
+    bigint surrogate key: the first 64 bits of dbt_utils.generate_surrogate_key's md5, so
+    null handling and field order match it. 8-byte join keys instead of 32-char text; stateless,
+    so incremental models compute the same key as full refreshes.
+-#}
+{% macro int_surrogate_key(field_list) %}
+    ('x' || substr({{ dbt_utils.generate_surrogate_key(field_list) }}, 1, 16))::bit(64)::bigint
+{%- endmacro %}
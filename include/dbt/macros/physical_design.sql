@@ -0,0 +1,57 @@
+{#-
+    Physical design declared per model under config meta, applied by the project-level
+    post-hooks in dbt_project.yml:
+
+        meta={
+            'physical_indexes': [{'columns': ['order_key'], 'unique': True}, {'columns': ['date_key']}],
+            'cluster_by': ['date_key'],   -- columns of a declared index
+            'analyze': True,              -- default
+        }
+
+    Indexes are matched by definition rather than name, so reruns, incremental builds and
+    full refreshes (where the old table's indexes still exist until the swap) stay idempotent.
+    CLUSTER rewrites the table, so it only runs on full builds, not on incremental merges.
+-#}
+{% macro _existing_indexes(relation) %}
+    {%- set result = run_query(
+        "select i.indexrelid::regclass::text, i.indisunique, pg_get_indexdef(i.indexrelid) "
+        ~ "from pg_index i where i.indrelid = '" ~ relation ~ "'::regclass"
+    ) -%}
+    {%- set indexes = [] -%}
+    {%- for row in result.rows -%}
+        {%- do indexes.append({'name': row[0], 'unique': row[1], 'columns': row[2].split('(')[-1].rstrip(')')}) -%}
+    {%- endfor -%}
+    {{ return(indexes) }}
+{% endmacro %}
+
+{% macro physical_design_indexes() %}
+    {%- if execute -%}
+        {%- set existing = _existing_indexes(this) -%}
+        {%- for index in (config.get('meta') or {}).get('physical_indexes', []) -%}
+            {%- set columns = index['columns'] | join(', ') -%}
+            {%- set unique = index.get('unique', false) -%}
+            {%- if existing | selectattr('columns', 'equalto', columns) | selectattr('unique', 'equalto', unique) | list | length == 0 %}
+    create {{ 'unique ' if unique }}index on {{ this }} ({{ columns }});
+            {%- endif -%}
+        {%- endfor -%}
+    {%- endif -%}
+{% endmacro %}
+
+{% macro physical_design_maintenance() %}
+    {%- if execute -%}
+        {%- set meta = config.get('meta') or {} -%}
+        {%- set full_build = config.get('materialized') != 'incremental' or should_full_refresh() -%}
+        {%- if meta.get('cluster_by') and full_build -%}
+            {%- set columns = meta['cluster_by'] | join(', ') -%}
+            {%- set matches = _existing_indexes(this) | selectattr('columns', 'equalto', columns) | list -%}
+            {%- if matches %}
+    cluster {{ this }} using {{ matches[0]['name'].split('.')[-1] }};
+            {%- else -%}
+                {%- do log("cluster_by " ~ columns ~ " on " ~ this ~ " has no matching index, skipped", info=true) -%}
+            {%- endif -%}
+        {%- endif -%}
+        {%- if meta.get('analyze', true) %}
+    analyze {{ this }};
+        {%- endif -%}
+    {%- endif -%}
+{% endmacro %}
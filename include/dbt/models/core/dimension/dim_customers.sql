@@ -1,15 +1,17 @@
 {{ config(
     materialized='table',
     schema='dwh_e-com',
+    meta={'physical_indexes': [{'columns': ['customer_sk'], 'unique': True}, {'columns': ['customer_id']}]},
     tags=['dimension']
 ) }}
 
 select
-    {{ dbt_utils.generate_surrogate_key(['customer_id', 'email']) }} as customer_sk,
+    {{ int_surrogate_key(['customer_id', 'email']) }} as customer_sk,
     customer_id,
     email,
     name,
     country,
     status,
     created_at
-FROM {{ ref('stg_customers') }}
\ No newline at end of file
+FROM {{ ref('stg_customers') }}
+WHERE NOT is_deleted
\ No newline at end of file
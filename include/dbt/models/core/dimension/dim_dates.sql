@@ -2,7 +2,8 @@
 {{ config(
     materialized='table',
     schema='dwh_e-com',
-    tags=['dimension'
+    meta={'physical_indexes': [{'columns': ['date_sk'], 'unique': True}, {'columns': ['date_day']}]},
+    tags=['dimension']
 ) }}
 
 with dates as (
@@ -14,7 +15,7 @@ with dates as (
         )::date as date_day
 )
 select
-    {{ dbt_utils.generate_surrogate_key(['date_day']) }} as date_sk,
+    {{ date_key('date_day') }} as date_sk,
     date_day,
     extract(year from date_day) as year,
     extract(month from date_day) as month,
@@ -1,12 +1,16 @@
 {{ config(
        materialized='table',
        schema='dwh_e-com',
+       meta={'physical_indexes': [{'columns': ['variant_sk'], 'unique': True}, {'columns': ['variant_id']}]},
        tags=['dimension']
 ) }}
 
 select
-    {{ dbt_utils.generate_surrogate_key(['variant_id', 'price']) }} as variant_sk,
-    variant_id,
-    {{ dbt_utils.generate_surrogate_key(['product_id']) }} as product_sk,
-    price
-from {{ ref('stg_product_variants') }}
+    {{ int_surrogate_key(['vrt.variant_id', 'vrt.price']) }} as variant_sk,
+    vrt.variant_id,
+    pdt.product_sk,
+    vrt.price
+from {{ ref('stg_product_variants') }} vrt
+left join {{ ref('dim_products') }} pdt
+    on vrt.product_id = pdt.product_id
+where not vrt.is_deleted
@@ -1,12 +1,14 @@
 {{ config(
     materialized='table',
     schema='dwh_e-com',
+    meta={'physical_indexes': [{'columns': ['product_sk'], 'unique': True}, {'columns': ['product_id']}]},
     tags=['dimension']
 ) }}
 
 select
-    {{ dbt_utils.generate_surrogate_key(['product_id', 'title']) }} as product_sk,
+    {{ int_surrogate_key(['product_id', 'title']) }} as product_sk,
     product_id,
     title,
     category
-FROM {{ ref('stg_products') }}
\ No newline at end of file
+FROM {{ ref('stg_products') }}
+WHERE NOT is_deleted
\ No newline at end of file
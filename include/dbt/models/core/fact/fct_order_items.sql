@@ -1,8 +1,18 @@
 {{ config(
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_item_key',
+    meta={
+        'physical_indexes': [{'columns': ['order_item_key'], 'unique': True}, {'columns': ['date_key']}, {'columns': ['order_key']}, {'columns': ['product_key']}],
+        'cluster_by': ['date_key'],
+    },
+    on_schema_change='append_new_columns',
     schema='dwh_e-com',
     tags=['fact']
 ) }}
+-- Incremental: only rows whose staging row (or parent order) was re-staged since the last
+-- build; the DAG full-refreshes periodically to pick up dimension changes and deletes
+{% set watermark = incremental_watermark('source_load_ts', lookback='0 minutes') %}
 
 with order_items as (
     select
@@ -15,16 +25,25 @@ with order_items as (
         discount,
         tax,
         total_price,
-        created_at
+        created_at,
+        created_date_key,
+        load_ts
     from {{ ref('stg_order_items') }}
+    where not is_deleted
+    {% if is_incremental() %}
+      and (load_ts > {{ watermark }}
+       or order_id in (select order_id from {{ ref('stg_orders') }} where load_ts > {{ watermark }}))
+    {% endif %}
 ),
 
 orders as (
     select
         order_id,
         customer_id,
-        order_at
+        order_at,
+        load_ts
     from {{ ref('stg_orders') }}
+    where not is_deleted
 ),
 
 customers as (
@@ -46,28 +65,22 @@ product_variants as (
         variant_sk, 
         variant_id
     from {{ ref('dim_product_variants') }}
-),
-
-dates as (
-    select 
-        date_sk, 
-        date_day
-    from {{ ref('dim_dates') }}
 )
 
 select
-    {{ dbt_utils.generate_surrogate_key(['odr_itm.order_item_id', 'odr_itm.product_id','odr_itm.variant_id']) }} as order_item_key,
+    {{ int_surrogate_key(['odr_itm.order_item_id', 'odr_itm.product_id','odr_itm.variant_id']) }} as order_item_key,
     odr_itm.order_item_id,
-    ods.order_id as order_key,
+    case when ods.order_id is not null then {{ int_surrogate_key(['ods.order_id']) }} end as order_key,
     pds.product_sk as product_key,
     pds_vrs.variant_sk as variant_key,
-    dte.date_sk as date_key,
+    odr_itm.created_date_key as date_key,
     odr_itm.quantity,
     odr_itm.unit_price,
     odr_itm.discount,
     odr_itm.tax,
     odr_itm.total_price,
-    ods.order_at as order_date
+    ods.order_at as order_date,
+    greatest(odr_itm.load_ts, ods.load_ts) as source_load_ts
 from order_items odr_itm
 left join orders ods
     on odr_itm.order_id = ods.order_id
@@ -75,5 +88,3 @@ left join products pds
     on odr_itm.product_id = pds.product_id
 left join product_variants pds_vrs
     on odr_itm.variant_id = pds_vrs.variant_id
-left join dates dte
-    on cast(odr_itm.created_at as date) = dte.date_day
\ No newline at end of file
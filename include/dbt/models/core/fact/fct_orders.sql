@@ -1,8 +1,18 @@
 {{ config(
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_key',
+    meta={
+        'physical_indexes': [{'columns': ['order_key'], 'unique': True}, {'columns': ['date_key']}, {'columns': ['customer_key']}],
+        'cluster_by': ['date_key'],
+    },
+    on_schema_change='append_new_columns',
     schema='dwh_e-com',
     tags=['fact']
 ) }}
+-- Incremental: only orders re-staged since the last build; the DAG full-refreshes
+-- periodically to pick up dimension changes and deletes
+{% set watermark = incremental_watermark('source_load_ts', lookback='0 minutes') %}
 
 with orders as (
     select
@@ -12,8 +22,14 @@ with orders as (
         order_at,
         status,
         currency,
-        total_amount
+        total_amount,
+        order_date_key,
+        load_ts
     from {{ ref('stg_orders') }}
+    where not is_deleted
+    {% if is_incremental() %}
+      and load_ts > {{ watermark }}
+    {% endif %}
 ),
 
 customers as (
@@ -21,26 +37,18 @@ customers as (
         customer_sk, 
         customer_id
     from {{ ref('dim_customers') }}
-),
-
-dates as (
-    select 
-        date_sk, 
-        date_day
-    from {{ ref('dim_dates') }}
 )
 
 select
-    {{ dbt_utils.generate_surrogate_key(['ods.order_id']) }} as order_key,
+    {{ int_surrogate_key(['ods.order_id']) }} as order_key,
     ods.order_id,
     cts.customer_sk as customer_key,
-    dte.date_sk as date_key,
+    ods.order_date_key as date_key,
     ods.order_at as order_date,
     ods.status,
     ods.currency,
-    ods.total_amount as order_amount
+    ods.total_amount as order_amount,
+    ods.load_ts as source_load_ts
 from orders ods
 left join customers cts
     on ods.customer_id = cts.customer_id
-left join dates dte
-    on cast(ods.order_at as date) = dte.date_day
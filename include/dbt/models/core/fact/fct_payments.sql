@@ -1,9 +1,19 @@
 -- Grain: one row per payment transaction
 {{ config(
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='payment_key',
+    meta={
+        'physical_indexes': [{'columns': ['payment_key'], 'unique': True}, {'columns': ['date_key']}, {'columns': ['order_id']}],
+        'cluster_by': ['date_key'],
+    },
+    on_schema_change='append_new_columns',
     schema='dwh_e-com',
     tags=['fact']
 ) }}
+-- Incremental: only rows whose staging row (or parent order) was re-staged since the last
+-- build; the DAG full-refreshes periodically to pick up dimension changes and deletes
+{% set watermark = incremental_watermark('source_load_ts', lookback='0 minutes') %}
 
 with payments as (
     select 
@@ -12,15 +22,24 @@ with payments as (
         payment_method,
         amount,
         paid_at,
-        status
+        status,
+        paid_date_key,
+        load_ts
     from {{ ref('stg_payments') }}
+    where not is_deleted
+    {% if is_incremental() %}
+      and (load_ts > {{ watermark }}
+       or order_id in (select order_id from {{ ref('stg_orders') }} where load_ts > {{ watermark }}))
+    {% endif %}
 ),
 
 orders as (
     select
         order_id,
-        customer_id
+        customer_id,
+        load_ts
     from {{ ref('stg_orders') }}
+    where not is_deleted
 ),
 
 customers as (
@@ -28,29 +47,21 @@ customers as (
         customer_sk, 
         customer_id
     from {{ ref('dim_customers') }}
-),
-
-dates as (
-    select 
-        date_sk, 
-        date_day
-    from {{ ref('dim_dates') }}
 )
 
 select
-    {{ dbt_utils.generate_surrogate_key(['pay.payment_id', 'pay.order_id']) }} as payment_key,
+    {{ int_surrogate_key(['pay.payment_id', 'pay.order_id']) }} as payment_key,
     pay.payment_id,
     ods.order_id,
     cts.customer_sk as customer_key,
-    dte.date_sk as date_key,
+    pay.paid_date_key as date_key,
     pay.paid_at as paid_date,
     pay.amount,
     pay.payment_method,
-    pay.status
+    pay.status,
+    greatest(pay.load_ts, ods.load_ts) as source_load_ts
 from payments pay
 left join orders ods
     on pay.order_id = ods.order_id
 left join customers cts
     on ods.customer_id = cts.customer_id
-left join dates dte
-    on cast(pay.paid_at as date) = dte.date_day
\ No newline at end of file
@@ -1,9 +1,19 @@
 -- Grain: one row per shipment event
 {{ config(
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='shipment_key',
+    meta={
+        'physical_indexes': [{'columns': ['shipment_key'], 'unique': True}, {'columns': ['date_key']}, {'columns': ['order_id']}],
+        'cluster_by': ['date_key'],
+    },
+    on_schema_change='append_new_columns',
     schema='dwh_e-com',
     tags=['fact']
 ) }}
+-- Incremental: only rows whose staging row (or parent order) was re-staged since the last
+-- build; the DAG full-refreshes periodically to pick up dimension changes and deletes
+{% set watermark = incremental_watermark('source_load_ts', lookback='0 minutes') %}
 
 with shipments as (
     select 
@@ -13,36 +23,37 @@ with shipments as (
         service,
         tracking_number,
         shipped_at,
-        status
+        status,
+        shipped_date_key,
+        load_ts
     from {{ ref('stg_shipments') }}
+    where not is_deleted
+    {% if is_incremental() %}
+      and (load_ts > {{ watermark }}
+       or order_id in (select order_id from {{ ref('stg_orders') }} where load_ts > {{ watermark }}))
+    {% endif %}
 ),
 
 orders as (
     select
         order_id,
-        customer_id
+        customer_id,
+        load_ts
     from {{ ref('stg_orders') }}
-),
-
-dates as (
-    select 
-        date_sk, 
-        date_day
-    from {{ ref('dim_dates') }}
+    where not is_deleted
 )
 
 select
-    {{ dbt_utils.generate_surrogate_key(['sps.shipment_id', 'sps.order_id']) }} as shipment_key,
+    {{ int_surrogate_key(['sps.shipment_id', 'sps.order_id']) }} as shipment_key,
     sps.shipment_id,
     ods.order_id,
-    dte.date_sk as date_key,
+    sps.shipped_date_key as date_key,
     sps.shipped_at as ship_date,
     sps.carrier,
     sps.service,
     sps.tracking_number,
-    sps.status
+    sps.status,
+    greatest(sps.load_ts, ods.load_ts) as source_load_ts
 from shipments sps
 left join orders ods
     on sps.order_id = ods.order_id
-left join dates dte
-    on cast(sps.shipped_at as date) = dte.date_day
\ No newline at end of file
@@ -0,0 +1,27 @@
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_key',
+    on_schema_change='append_new_columns',
+    schema='mart_intermediate',
+    meta={'physical_indexes': [{'columns': ['order_key'], 'unique': True}]},
+    tags=['mart', 'intermediate']
+) }}
+-- Grain: one row per order. fct_order_items is aggregated here once per mart run
+-- and every mart reads this rollup instead of re-aggregating the fact.
+-- Incremental: only orders with item rows re-staged since the last build are re-aggregated
+{% set watermark = incremental_watermark('source_load_ts', lookback='0 minutes') %}
+
+select
+    order_key,
+    count(*)                        as total_items,
+    sum(quantity)                   as total_quantity,
+    sum(quantity * unit_price)      as order_revenue,
+    avg(unit_price)                 as avg_item_price,
+    max(source_load_ts)             as source_load_ts
+from {{ ref('fct_order_items') }}
+where order_key is not null
+{% if is_incremental() %}
+  and order_key in (select order_key from {{ ref('fct_order_items') }} where source_load_ts > {{ watermark }})
+{% endif %}
+group by order_key
@@ -0,0 +1,26 @@
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_id',
+    on_schema_change='append_new_columns',
+    schema='mart_intermediate',
+    meta={'physical_indexes': [{'columns': ['order_id'], 'unique': True}]},
+    tags=['mart', 'intermediate']
+) }}
+-- Grain: one row per order; payment totals shared by the marts.
+-- Incremental: only orders with payment rows re-staged since the last build are re-aggregated
+{% set watermark = incremental_watermark('source_load_ts', lookback='0 minutes') %}
+
+select
+    order_id,
+    count(*)                                                    as payment_count,
+    sum(amount)                                                 as total_payment_amount,
+    coalesce(sum(amount) filter (where status = 'paid'), 0)     as total_paid_amount,
+    (array_agg(status order by paid_date desc nulls last))[1]   as payment_status,
+    max(source_load_ts)                                         as source_load_ts
+from {{ ref('fct_payments') }}
+where order_id is not null
+{% if is_incremental() %}
+  and order_id in (select order_id from {{ ref('fct_payments') }} where source_load_ts > {{ watermark }})
+{% endif %}
+group by order_id
@@ -24,18 +24,16 @@ orders as (
        status,
 	   currency,
 	   order_amount
-    from {{ ref('fact_orders') }}
+    from {{ ref('fct_orders') }}
 ),
 
 order_items as (
    SELECT
        order_key,
-       count(*)                                   as total_items,
-       sum(quantity * unit_price)                 as order_revenue,
-       avg(unit_price)                            as avg_item_price
-   FROM {{ ref('fct_order_items') }}
-   GROUP BY order_key
-
+       total_items,
+       order_revenue,
+       avg_item_price
+   FROM {{ ref('int_order_items_rollup') }}
 ),
 
 customer_orders as (
@@ -62,9 +60,7 @@ customer_orders as (
 	left join orders ods
 	    on cts.customer_sk = ods.customer_key
 	LEFT JOIN order_items odi
-	    ON ods.order_id = odi.order_key
-	left join bronze_dwh_ecom.dim_dates dde
-	    on ods.order_date = dde.date_day
+	    ON ods.order_key = odi.order_key
 	group by
 	    cts.customer_sk,
 	    cts.customer_name,
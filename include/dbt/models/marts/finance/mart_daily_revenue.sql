@@ -1,8 +1,19 @@
+-- depends_on: {{ ref('fct_order_items') }}
+-- depends_on: {{ ref('fct_payments') }}
 {{ config(
-    materialized = 'table',
+    materialized = 'incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_date',
+    on_schema_change='append_new_columns',
     schema='mart_finance',
     tags=['mart']
 ) }}
+-- Incremental by day: only order days touched by fact rows re-staged since the last build,
+-- each fact against its own watermark (late items/payments included), are re-aggregated
+-- and replace their rows in this mart
+{% set orders_watermark = incremental_watermark('orders_load_ts', lookback='0 minutes') %}
+{% set items_watermark = incremental_watermark('items_load_ts', lookback='0 minutes') %}
+{% set payments_watermark = incremental_watermark('payments_load_ts', lookback='0 minutes') %}
 
 WITH orders as (
    SELECT
@@ -15,35 +26,30 @@ WITH orders as (
 	   currency,
 	   order_amount
    FROM {{ ref('fct_orders') }}
-
+   {% if is_incremental() %}
+   WHERE date_key in ({{ changed_order_date_keys(orders_watermark, items_watermark, payments_watermark) }})
+   {% endif %}
 ),
 
 order_items as (
    SELECT
        order_key,
-       count(*)                                   as total_items,
-       sum(quantity * unit_price)                 as order_revenue,
-       avg(unit_price)                            as avg_item_price
-   FROM {{ ref('fct_order_items') }}
-   GROUP BY order_key
-
+       total_items,
+       order_revenue,
+       avg_item_price
+   FROM {{ ref('int_order_items_rollup') }}
 ),
 
 payments as (
    SELECT
        order_id,
-       sum(amount)                                as total_paid_amount,
-       status                                     as payment_status
-   FROM {{ ref('fct_payments') }}
-   GROUP BY 
-       order_id,
-       AND payment_status = 'paid'
-
+       total_paid_amount
+   FROM {{ ref('int_order_payments_rollup') }}
 ),
 
 daily_revenue AS (
 	select
-	    ods.order_date:: date                          as order_date,
+	    dde.date_day                                   as order_date,
 	    coalesce(sum(ods.order_amount), 0)             as daily_revenue,
 	    coalesce(sum(pys.total_paid_amount), 0)        as total_payments_received,
 	    coalesce(count(distinct ods.order_id), 0)      as total_orders,
@@ -52,12 +58,12 @@ daily_revenue AS (
 	
 	from orders ods
 	LEFT JOIN order_items odi
-		    ON ods.order_id = odi.order_key
+		    ON ods.order_key = odi.order_key
 	left join payments pys
 	    on ods.order_id = pys.order_id
-	left join bronze_dwh_ecom.dim_dates dde
-	    on ods.order_date = dde.date_day
-	GROUP BY order_date
+	left join {{ ref('dim_dates') }} dde
+	    on ods.date_key = dde.date_sk
+	GROUP BY ods.date_key, dde.date_day
 )
 
 SELECT 
@@ -75,6 +81,9 @@ SELECT
     CASE
         WHEN unique_customers = 0 THEN 0
         ELSE daily_revenue / unique_customers
-    END as revenue_per_customer
+    END as revenue_per_customer,
+    {{ fact_high_water('fct_orders') }} as orders_load_ts,
+    {{ fact_high_water('fct_order_items') }} as items_load_ts,
+    {{ fact_high_water('fct_payments') }} as payments_load_ts
 
 FROM daily_revenue
\ No newline at end of file
@@ -34,7 +34,7 @@ customers as (
         name          AS customer_name,
         country
     from {{ ref('dim_customers') }}
-),
+)
 
 select
     shp.shipment_key,
@@ -1,9 +1,18 @@
+-- depends_on: {{ ref('fct_payments') }}
 {{ config(
-    materialized = 'table',
+    materialized = 'incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_date',
+    on_schema_change='append_new_columns',
     schema='mart_product',
     tags=['mart']
 ) }}
-
+-- Incremental by day: only order days touched by fact rows re-staged since the last build,
+-- each fact against its own watermark (late items/payments included), are re-aggregated
+-- and replace their rows in this mart
+{% set orders_watermark = incremental_watermark('orders_load_ts', lookback='0 minutes') %}
+{% set items_watermark = incremental_watermark('items_load_ts', lookback='0 minutes') %}
+{% set payments_watermark = incremental_watermark('payments_load_ts', lookback='0 minutes') %}
 
 WITH order_items as (
     select
@@ -16,16 +25,29 @@ WITH order_items as (
         unit_price,
         quantity * unit_price as item_revenue
     from {{ ref('fct_order_items') }}
+    {% if is_incremental() %}
+    where order_key in (
+        select order_key from {{ ref('fct_orders') }}
+        where date_key in ({{ changed_order_date_keys(orders_watermark, items_watermark, payments_watermark) }})
+    )
+    {% endif %}
 ),
 
 orders as (
     select
         order_key,
         order_id,
-        order_date
+        date_key
     from {{ ref('fct_orders') }}
 ),
 
+dates as (
+    select
+        date_sk,
+        date_day
+    from {{ ref('dim_dates') }}
+),
+
 products as (
     select
         product_sk           AS product_key,
@@ -41,11 +63,11 @@ variants as (
         variant_id,
         price
     from {{ ref('dim_product_variants') }}
-),
+)
 
 select
     pdt.product_key,
-    ods.order_date,
+    dte.date_day                                                       AS order_date,
     pdt.product_name,
     pdt.category,
     vrt.price,
@@ -53,18 +75,23 @@ select
     sum(odi.quantity)                                                  AS total_unit_sold,
     sum(odi.item_revenue)                                              AS total_revenue,
     avg(odi.unit_price)                                                AS avg_selling_price,
-    coalesce(sum(odi.item_revenue) / nullif(sum(odi.quantity), 0), 0)  AS revenue_per_unit
+    coalesce(sum(odi.item_revenue) / nullif(sum(odi.quantity), 0), 0)  AS revenue_per_unit,
+    {{ fact_high_water('fct_orders') }}                                AS orders_load_ts,
+    {{ fact_high_water('fct_order_items') }}                           AS items_load_ts,
+    {{ fact_high_water('fct_payments') }}                              AS payments_load_ts
     
 from order_items odi
 left join orders ods
-    on odi.order_key = ods.order_id
+    on odi.order_key = ods.order_key
 left join products pdt
-    on odi.product_key = pdt.product_sk
+    on odi.product_key = pdt.product_key
 left join variants vrt
     on odi.variant_key = vrt.variant_sk
-group by 
+left join dates dte
+    on ods.date_key = dte.date_sk
+group by
     pdt.product_key,
-    ods.order_date,
+    dte.date_day,
     pdt.product_name,
     pdt.category,
     vrt.price
@@ -22,23 +22,18 @@ WITH orders as (
 order_items as (
    SELECT
        order_key,
-       count(*)                                   as total_items,
-       sum(quantity * unit_price)                 as order_revenue,
-       avg(unit_price)                            as avg_item_price
-   FROM {{ ref('fct_order_items') }}
-   GROUP BY order_key
-
+       total_items,
+       order_revenue,
+       avg_item_price
+   FROM {{ ref('int_order_items_rollup') }}
 ),
 
 payments as (
    SELECT
        order_id,
-       sum(amount)                                as total_paid_amount,
-       status                                     as payment_status
-   FROM {{ ref('fct_payments') }}
-   GROUP BY 
-       order_id,
-       status
+       total_paid_amount,
+       payment_status
+   FROM {{ ref('int_order_payments_rollup') }}
 ),
 
 customers as (
@@ -55,11 +50,11 @@ select
    	ods.order_id,
    	ods.order_date,
       ods.order_status,
-   	coalesce(ctr.customer_name, 'Unkown'),           as customer_name
-   	coalesce(ctr.country, 'Unkown'),                 as country
+   	coalesce(ctr.customer_name, 'Unkown')            as customer_name,
+   	coalesce(ctr.country, 'Unkown')                  as country,
    
    	-- metrics
-   	distinct coalesce(odi.total_items, 0)            as unique_item_count, -- For numeric aggregations used in dashboards | Convert NULL → 0
+   	coalesce(odi.total_items, 0)                     as unique_item_count, -- For numeric aggregations used in dashboards | Convert NULL → 0
    	coalesce(odi.order_revenue, 0)                   as order_revenue, -- For numeric aggregations used in dashboards | Convert NULL → 0
    	CASE 
    	   WHEN coalesce(odi.total_items, 0) = 0 THEN 0
@@ -76,7 +71,7 @@ select
 
 FROM orders ods
 left join order_items odi
-   on ods.order_id = odi.order_key
+   on ods.order_key = odi.order_key
 left join payments pyt
    on ods.order_id = pyt.order_id
 left join customers ctr
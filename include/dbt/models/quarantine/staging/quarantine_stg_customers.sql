@@ -5,11 +5,12 @@
 
 select *
 from {{ ref('stg_customers') }}
-where
+where not is_deleted and (
     email is null
     or email not like '%@%'
     or customer_id is null
     or name is null
     or country is null
     or created_at is null
-    or status is null
\ No newline at end of file
+    or status is null
+)
\ No newline at end of file
@@ -5,7 +5,7 @@
 
 select *
 from {{ ref('stg_order_items') }}
-where
+where not is_deleted and (
     order_item_id is null
     or order_id is null
     or product_id is null
@@ -16,3 +16,4 @@ where
     or tax < 0
     or total_price < 0
     or created_at is null
+)
@@ -5,11 +5,12 @@
 
 select *
 from {{ ref('stg_payments') }}
-where
+where not is_deleted and (
     payment_id is null
     or order_id is null
     or amount < 0
     or status not in ('paid', 'pending', 'failed', 'refunded')
     or payment_method not in ('CreditCard', 'EWallet', 'PayNow', 'PayLater')
     or paid_at is null
-    or status is null
\ No newline at end of file
+    or status is null
+)
\ No newline at end of file
@@ -5,11 +5,12 @@
 
 select *
 from {{ ref('stg_product_variants') }}
-where
+where not is_deleted and (
     variant_id is null
     or product_id is null
     or sku is null
     or price < 0
     or barcode is null
     or cost < 0
-    or active is null
\ No newline at end of file
+    or active is null
+)
\ No newline at end of file
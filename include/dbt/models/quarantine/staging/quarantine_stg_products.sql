@@ -5,9 +5,10 @@
 
 select *
 from {{ ref('stg_products') }}
-where
+where not is_deleted and (
     product_id is null
     or title is null
     or category is null
     or brand is null
     or active is null
+)
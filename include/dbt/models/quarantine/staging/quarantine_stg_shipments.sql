@@ -5,7 +5,7 @@
 
 select *
 from {{ ref('stg_shipments') }}
-where
+where not is_deleted and (
     shipment_id is null
     or order_id is null
     or carrier is null
@@ -13,3 +13,4 @@ where
     or status is null
     or tracking_number is null
     or shipped_at is null
+)
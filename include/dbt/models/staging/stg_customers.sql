@@ -1,9 +1,26 @@
 {{ config(
     schema='staging',
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='customer_id',
+    meta={'physical_indexes': [{'columns': ['customer_id'], 'unique': True}, {'columns': ['load_ts']}]},
+    on_schema_change='append_new_columns',
     tags=['staging']
 ) }}
--- Cleaned + typed customer records coming from staging.customers (OLTP extract)
+-- Cleaned + typed customer records coming from bronze.customers_raw (OLTP extract)
+-- CDC compaction, incremental: only bronze rows ingested past the watermark, one version per
+-- customer_id (latest _ts). A version older than the staged one is a stale replay and is skipped;
+-- deletes (_op = 'D' / _deleted) replace the staged row as an is_deleted tombstone, kept so the
+-- guard still skips older replays; downstream models read `not is_deleted` rows only
+with delta as (
+    select distinct on (customer_id) *
+    from {{ source('bronze', 'customers_raw') }}
+    {% if is_incremental() %}
+    where _ingested_at > {{ incremental_watermark() }}
+    {% endif %}
+    order by customer_id, _ts desc nulls last, _ingested_at desc nulls last
+)
+
 select
         customer_id::bigint           as customer_id,
         lower(email)                  as email,
@@ -11,5 +28,17 @@ select
         nullif(trim(country), '')     as country,
         created_at::timestamp         as created_at,
         nullif(trim(status), '')      as status,
-        now()                         as load_ts
-from {{ source('bronze', 'customers_raw') }}
\ No newline at end of file
+        now()                         as load_ts,
+        _ingested_at                  as _ingested_at,
+        _batch_id                     as _batch_id,
+        _ts                           as _ts,
+        (coalesce(_op = 'D', false) or coalesce(_deleted, false)) as is_deleted
+from delta
+{% if is_incremental() %}
+where not exists (
+    select 1
+    from {{ this }} as staged
+    where staged.customer_id = delta.customer_id
+      and staged._ts > delta._ts
+)
+{% endif %}
@@ -1,9 +1,24 @@
-  GNU nano 6.2                      stg_order_items.sql
 {{ config(
     schema='staging',
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_item_id',
+    meta={'physical_indexes': [{'columns': ['order_item_id'], 'unique': True}, {'columns': ['load_ts']}]},
+    on_schema_change='append_new_columns',
     tags=['staging']
 ) }}
+-- CDC compaction, incremental: only bronze rows ingested past the watermark, one version per
+-- order_item_id (latest _ts). A version older than the staged one is a stale replay and is skipped;
+-- deletes (_op = 'D' / _deleted) replace the staged row as an is_deleted tombstone, kept so the
+-- guard still skips older replays; downstream models read `not is_deleted` rows only
+with delta as (
+    select distinct on (order_item_id) *
+    from {{ source('bronze', 'order_items_raw') }}
+    {% if is_incremental() %}
+    where _ingested_at > {{ incremental_watermark() }}
+    {% endif %}
+    order by order_item_id, _ts desc nulls last, _ingested_at desc nulls last
+)
 
 select
         order_item_id::bigint        as order_item_id,
@@ -16,5 +31,18 @@ select
         tax::int                     as tax,
         line_amount::int             as total_price,
         created_at::timestamp        as created_at,
-        now()                        as load_ts
-from {{ source('bronze', 'order_items_raw') }}
\ No newline at end of file
+        {{ date_key('created_at::timestamp') }} as created_date_key,
+        now()                        as load_ts,
+        _ingested_at                 as _ingested_at,
+        _batch_id                    as _batch_id,
+        _ts                          as _ts,
+        (coalesce(_op = 'D', false) or coalesce(_deleted, false)) as is_deleted
+from delta
+{% if is_incremental() %}
+where not exists (
+    select 1
+    from {{ this }} as staged
+    where staged.order_item_id = delta.order_item_id
+      and staged._ts > delta._ts
+)
+{% endif %}
@@ -1,16 +1,46 @@
 {{ config(
     schema='staging',
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='order_id',
+    meta={'physical_indexes': [{'columns': ['order_id'], 'unique': True}, {'columns': ['load_ts']}]},
+    on_schema_change='append_new_columns',
     tags=['staging']
 ) }}
--- Cleaned + typed customer records coming from staging.customers (OLTP extract)
+-- Cleaned + typed order records coming from bronze.orders_raw (OLTP extract)
+-- CDC compaction, incremental: only bronze rows ingested past the watermark, one version per
+-- order_id (latest _ts). A version older than the staged one is a stale replay and is skipped;
+-- deletes (_op = 'D' / _deleted) replace the staged row as an is_deleted tombstone, kept so the
+-- guard still skips older replays; downstream models read `not is_deleted` rows only
+with delta as (
+    select distinct on (order_id) *
+    from {{ source('bronze', 'orders_raw') }}
+    {% if is_incremental() %}
+    where _ingested_at > {{ incremental_watermark() }}
+    {% endif %}
+    order by order_id, _ts desc nulls last, _ingested_at desc nulls last
+)
+
 select
         order_id::bigint              as order_id,
         customer_id::bigint           as customer_id,
         channel_id::int               as channel_id,
         order_ts::timestamp           as order_at,
+        {{ date_key('order_ts::timestamp') }} as order_date_key,
         nullif(trim(status), '')      as status,
-        nullif(trim(currency), ''),   as currency,
+        nullif(trim(currency), '')    as currency,
         total_amount::bigint          as total_amount,
-        now()                         as load_ts
-from {{ source('bronze', 'orders_raw') }}
\ No newline at end of file
+        now()                         as load_ts,
+        _ingested_at                  as _ingested_at,
+        _batch_id                     as _batch_id,
+        _ts                           as _ts,
+        (coalesce(_op = 'D', false) or coalesce(_deleted, false)) as is_deleted
+from delta
+{% if is_incremental() %}
+where not exists (
+    select 1
+    from {{ this }} as staged
+    where staged.order_id = delta.order_id
+      and staged._ts > delta._ts
+)
+{% endif %}
@@ -1,8 +1,24 @@
 {{ config(
     schema='staging',
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='variant_id',
+    meta={'physical_indexes': [{'columns': ['variant_id'], 'unique': True}, {'columns': ['load_ts']}]},
+    on_schema_change='append_new_columns',
     tags=['staging']
 ) }}
+-- CDC compaction, incremental: only bronze rows ingested past the watermark, one version per
+-- variant_id (latest _ts). A version older than the staged one is a stale replay and is skipped;
+-- deletes (_op = 'D' / _deleted) replace the staged row as an is_deleted tombstone, kept so the
+-- guard still skips older replays; downstream models read `not is_deleted` rows only
+with delta as (
+    select distinct on (variant_id) *
+    from {{ source('bronze', 'product_variants_raw') }}
+    {% if is_incremental() %}
+    where _ingested_at > {{ incremental_watermark() }}
+    {% endif %}
+    order by variant_id, _ts desc nulls last, _ingested_at desc nulls last
+)
 
 select
         variant_id::bigint           as variant_id,
@@ -12,5 +28,17 @@ select
         price::int                   as price,
         cost::int                    as cost,
         active::boolean              as active,
-        now()                        as load_ts
-from {{ source('bronze', 'product_variants_raw') }}
\ No newline at end of file
+        now()                        as load_ts,
+        _ingested_at                 as _ingested_at,
+        _batch_id                    as _batch_id,
+        _ts                          as _ts,
+        (coalesce(_op = 'D', false) or coalesce(_deleted, false)) as is_deleted
+from delta
+{% if is_incremental() %}
+where not exists (
+    select 1
+    from {{ this }} as staged
+    where staged.variant_id = delta.variant_id
+      and staged._ts > delta._ts
+)
+{% endif %}
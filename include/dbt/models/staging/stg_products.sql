@@ -1,8 +1,24 @@
-{ config(
+{{ config(
     schema='staging',
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='product_id',
+    meta={'physical_indexes': [{'columns': ['product_id'], 'unique': True}, {'columns': ['load_ts']}]},
+    on_schema_change='append_new_columns',
     tags=['staging']
 ) }}
+-- CDC compaction, incremental: only bronze rows ingested past the watermark, one version per
+-- product_id (latest _ts). A version older than the staged one is a stale replay and is skipped;
+-- deletes (_op = 'D' / _deleted) replace the staged row as an is_deleted tombstone, kept so the
+-- guard still skips older replays; downstream models read `not is_deleted` rows only
+with delta as (
+    select distinct on (product_id) *
+    from {{ source('bronze', 'products_raw') }}
+    {% if is_incremental() %}
+    where _ingested_at > {{ incremental_watermark() }}
+    {% endif %}
+    order by product_id, _ts desc nulls last, _ingested_at desc nulls last
+)
 
 select
         product_id::bigint           as product_id,
@@ -11,5 +27,17 @@ select
         trim(brand)                  as brand,
         active::boolean              as active,
         created_at::timestamp        as created_at,
-        now()                        as load_ts
-from {{ source('bronze', 'products_raw') }}
\ No newline at end of file
+        now()                        as load_ts,
+        _ingested_at                 as _ingested_at,
+        _batch_id                    as _batch_id,
+        _ts                          as _ts,
+        (coalesce(_op = 'D', false) or coalesce(_deleted, false)) as is_deleted
+from delta
+{% if is_incremental() %}
+where not exists (
+    select 1
+    from {{ this }} as staged
+    where staged.product_id = delta.product_id
+      and staged._ts > delta._ts
+)
+{% endif %}